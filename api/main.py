@@ -1,609 +1,1194 @@
-"""
-FastAPI service for Space Biology Knowledge Graph.
-
-Provides endpoints for:
-- Health check
-- Semantic search over papers
-- Question answering with RAG
-- Knowledge graph queries
-"""
-
-import os
-import logging
-from pathlib import Path
-from typing import List, Dict, Any, Optional
-
-from fastapi import FastAPI, HTTPException, Query
-from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from dotenv import load_dotenv
-
-try:
-    from api.rag_index import RAGIndex
-except ImportError:
-    RAGIndex = None
-
-try:
-    from neo4j import GraphDatabase
-except ImportError:
-    GraphDatabase = None
-
-load_dotenv()
-
-# Configure logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
-
-# Initialize FastAPI app
-app = FastAPI(
-    title="Space Biology Knowledge Graph API",
-    description="API for searching and querying space biology research papers",
-    version="1.0.0"
-)
-
-# CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# Global RAG index
-rag_index: Optional[RAGIndex] = None
-
-# Global Neo4j driver
-neo4j_driver = None
-
-
-# Helper function to get Neo4j session
-def get_neo4j_session():
-    """Get Neo4j session."""
-    if neo4j_driver is None:
-        raise HTTPException(status_code=503, detail="Neo4j not connected")
-    return neo4j_driver.session()
-
-
-# Request/Response models
-class SearchRequest(BaseModel):
-    q: str
-    top_k: int = 5
-
-
-class AnswerRequest(BaseModel):
-    q: str
-    top_k: int = 5
-    model: str = "gpt-4"
-
-
-class SearchResponse(BaseModel):
-    query: str
-    results: List[Dict[str, Any]]
-    num_results: int
-
-
-class AnswerResponse(BaseModel):
-    question: str
-    answer: str
-    sources: List[Dict[str, Any]]
-    num_sources: int
-
-
-@app.on_event("startup")
-async def startup_event():
-    """Initialize RAG index and Neo4j connection on startup."""
-    global rag_index, neo4j_driver
-
-    # Initialize RAG index
-    index_path = Path(os.getenv("RAG_INDEX_PATH", "data/rag/index.faiss"))
-
-    if RAGIndex is None:
-        logger.warning("RAGIndex not available. Search endpoints will not work.")
-    else:
-        if index_path.exists():
-            try:
-                logger.info(f"Loading RAG index from {index_path}")
-                rag_index = RAGIndex(index_path=index_path)
-                logger.info(f"RAG index loaded with {len(rag_index.chunks)} chunks")
-            except Exception as e:
-                logger.error(f"Failed to load RAG index: {e}")
-                rag_index = None
-        else:
-            logger.warning(f"RAG index not found at {index_path}. Build it first with: python -m api.rag_index")
-
-    # Initialize Neo4j connection
-    if GraphDatabase is None:
-        logger.warning("Neo4j driver not available. Graph endpoints will not work.")
-    else:
-        neo4j_uri = os.getenv("NEO4J_URI", "bolt://localhost:7687")
-        neo4j_user = os.getenv("NEO4J_USER", "neo4j")
-        neo4j_password = os.getenv("NEO4J_PASSWORD", "spacebio123")
-
-        try:
-            logger.info(f"Connecting to Neo4j at {neo4j_uri}")
-            neo4j_driver = GraphDatabase.driver(neo4j_uri, auth=(neo4j_user, neo4j_password))
-            # Test connection
-            with neo4j_driver.session() as session:
-                result = session.run("RETURN 1 AS test")
-                result.single()
-            logger.info("Neo4j connection successful")
-        except Exception as e:
-            logger.error(f"Failed to connect to Neo4j: {e}")
-            neo4j_driver = None
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Close Neo4j connection on shutdown."""
-    global neo4j_driver
-    if neo4j_driver is not None:
-        try:
-            neo4j_driver.close()
-            logger.info("Neo4j connection closed")
-        except Exception as e:
-            logger.error(f"Error closing Neo4j connection: {e}")
-
-
-@app.get("/")
-async def root():
-    """Root endpoint."""
-    return {
-        "message": "Space Biology Knowledge Graph API",
-        "version": "1.0.0",
-        "endpoints": {
-            "health": "GET /health - Health check and status",
-            "search": "POST /search - Semantic search over papers",
-            "answer": "POST /answer - Question answering with RAG",
-            "papers": "GET /papers/{pmcid} - Get paper details",
-            "gap": "GET /kg/gap - Knowledge gap analysis",
-            "consensus": "GET /kg/consensus?phenotype={name} - Consensus analysis",
-            "graph": "GET /kg/graph - Knowledge graph visualization"
-        }
-    }
-
-
-@app.get("/health")
-async def health():
-    """Health check endpoint."""
-    neo4j_status = "disconnected"
-    neo4j_node_count = 0
-
-    if neo4j_driver is not None:
-        try:
-            with neo4j_driver.session() as session:
-                result = session.run("MATCH (n) RETURN count(n) AS count")
-                neo4j_node_count = result.single()["count"]
-                neo4j_status = "connected"
-        except Exception as e:
-            neo4j_status = f"error: {str(e)}"
-
-    return {
-        "status": "healthy",
-        "rag_index_loaded": rag_index is not None,
-        "num_chunks": len(rag_index.chunks) if rag_index else 0,
-        "neo4j_status": neo4j_status,
-        "neo4j_node_count": neo4j_node_count
-    }
-
-
-@app.post("/search", response_model=SearchResponse)
-async def search(request: SearchRequest):
-    """
-    Semantic search over paper paragraphs.
-
-    Returns top-k most similar chunks with metadata.
-    """
-    if rag_index is None:
-        raise HTTPException(status_code=503, detail="RAG index not available")
-
-    try:
-        results = rag_index.search(request.q, top_k=request.top_k)
-
-        return SearchResponse(
-            query=request.q,
-            results=[r.to_dict() for r in results],
-            num_results=len(results)
-        )
-
-    except Exception as e:
-        logger.error(f"Search error: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
-
-
-@app.post("/answer", response_model=AnswerResponse)
-async def answer(request: AnswerRequest):
-    """
-    Answer a question using RAG.
-
-    Retrieves relevant chunks and synthesizes an answer with LLM.
-    """
-    if rag_index is None:
-        raise HTTPException(status_code=503, detail="RAG index not available")
-
-    try:
-        result = rag_index.answer_question(
-            question=request.q,
-            top_k=request.top_k,
-            model=request.model
-        )
-
-        return AnswerResponse(**result)
-
-    except Exception as e:
-        logger.error(f"Answer error: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
-
-
-@app.get("/search")
-async def search_get(
-    q: str = Query(..., description="Search query"),
-    top_k: int = Query(5, description="Number of results")
-):
-    """GET version of search endpoint for convenience."""
-    return await search(SearchRequest(q=q, top_k=top_k))
-
-
-@app.get("/answer")
-async def answer_get(
-    q: str = Query(..., description="Question to answer"),
-    top_k: int = Query(5, description="Number of chunks to retrieve"),
-    model: str = Query("gpt-4", description="LLM model to use")
-):
-    """GET version of answer endpoint for convenience."""
-    return await answer(AnswerRequest(q=q, top_k=top_k, model=model))
-
-
-# Neo4j-powered endpoints
-@app.get("/papers/{pmcid}")
-async def get_paper(pmcid: str):
-    """
-    Get paper metadata and findings by PMCID.
-
-    Returns:
-        Paper metadata with associated experiments and findings
-    """
-    if neo4j_driver is None:
-        raise HTTPException(status_code=503, detail="Neo4j not connected")
-
-    try:
-        with get_neo4j_session() as session:
-            # Query paper with findings
-            query = """
-            MATCH (p:Paper {pmcid: $pmcid})
-            OPTIONAL MATCH (p)-[:REPORTS]->(f:Finding)
-            OPTIONAL MATCH (f)-[:AFFECTS]->(ph:Phenotype)
-            OPTIONAL MATCH (f)-[:OBSERVED_IN]->(t:Tissue)
-            OPTIONAL MATCH (f)-[:INVOLVES]->(o:Organism)
-            RETURN p,
-                   collect(DISTINCT {
-                       finding_id: f.uuid,
-                       direction: f.direction,
-                       magnitude_value: f.magnitude_value,
-                       magnitude_unit: f.magnitude_unit,
-                       p_value: f.p_value,
-                       evidence_strength: f.evidence_strength,
-                       phenotype: ph.label,
-                       tissue: t.label,
-                       organism: o.label
-                   }) AS findings
-            """
-
-            result = session.run(query, pmcid=pmcid)
-            record = result.single()
-
-            if not record:
-                raise HTTPException(status_code=404, detail=f"Paper {pmcid} not found")
-
-            paper = dict(record["p"])
-            findings = [f for f in record["findings"] if f.get("finding_id")]
-
-            return {
-                "pmcid": paper.get("pmcid"),
-                "title": paper.get("title"),
-                "doi": paper.get("doi"),
-                "year": paper.get("year"),
-                "journal": paper.get("journal"),
-                "authors": paper.get("authors", []),
-                "findings": findings,
-                "num_findings": len(findings)
-            }
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error fetching paper {pmcid}: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
-
-
-@app.get("/kg/gap")
-async def knowledge_gap(
-    organism: Optional[str] = Query(None, description="Filter by organism label"),
-    tissue: Optional[str] = Query(None, description="Filter by tissue label"),
-    exposure: Optional[str] = Query(None, description="Filter by exposure type"),
-    duration: Optional[str] = Query(None, description="Filter by duration")
-):
-    """
-    Query knowledge gaps in the graph.
-
-    Returns a matrix showing combinations of organism × tissue × exposure × duration
-    with study counts for gap analysis.
-    """
-    if neo4j_driver is None:
-        raise HTTPException(status_code=503, detail="Neo4j not connected")
-
-    try:
-        with get_neo4j_session() as session:
-            # Build dynamic query based on filters
-            conditions = []
-            params = {}
-
-            if organism:
-                conditions.append("o.label = $organism")
-                params["organism"] = organism
-            if tissue:
-                conditions.append("t.label = $tissue")
-                params["tissue"] = tissue
-            if exposure:
-                conditions.append("e.type = $exposure")
-                params["exposure"] = exposure
-            if duration:
-                conditions.append("d.label = $duration")
-                params["duration"] = duration
-
-            where_clause = "WHERE " + " AND ".join(conditions) if conditions else ""
-
-            query = f"""
-            MATCH (p:Paper)-[:DESCRIBES]->(exp:Experiment)
-            OPTIONAL MATCH (exp)-[:INVOLVES]->(o:Organism)
-            OPTIONAL MATCH (exp)-[:INVOLVES]->(t:Tissue)
-            OPTIONAL MATCH (exp)-[:APPLIES]->(e:Exposure)
-            OPTIONAL MATCH (exp)-[:HAS_DURATION]->(d:Duration)
-            {where_clause}
-            WITH o.label AS organism,
-                 t.label AS tissue,
-                 e.type AS exposure,
-                 d.label AS duration,
-                 count(DISTINCT p) AS study_count,
-                 avg(p.year) AS avg_year
-            RETURN organism, tissue, exposure, duration, study_count, avg_year
-            ORDER BY study_count DESC
-            LIMIT 1000
-            """
-
-            result = session.run(query, **params)
-
-            gaps = []
-            for record in result:
-                gaps.append({
-                    "organism": record["organism"],
-                    "tissue": record["tissue"],
-                    "exposure": record["exposure"],
-                    "duration": record["duration"],
-                    "study_count": record["study_count"],
-                    "avg_year": int(record["avg_year"]) if record["avg_year"] else None
-                })
-
-            return {
-                "filters": {
-                    "organism": organism,
-                    "tissue": tissue,
-                    "exposure": exposure,
-                    "duration": duration
-                },
-                "gaps": gaps,
-                "num_combinations": len(gaps)
-            }
-
-    except Exception as e:
-        logger.error(f"Error in gap analysis: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
-
-
-@app.get("/kg/consensus")
-async def consensus_analysis(
-    phenotype: str = Query(..., description="Phenotype label to analyze")
-):
-    """
-    Analyze consensus/disagreement on a phenotype.
-
-    Returns:
-        - Total studies analyzing this phenotype
-        - Distribution of findings by direction (increase/decrease/no_change)
-        - Agreement score
-        - Confidence bands
-    """
-    if neo4j_driver is None:
-        raise HTTPException(status_code=503, detail="Neo4j not connected")
-
-    try:
-        with get_neo4j_session() as session:
-            query = """
-            MATCH (ph:Phenotype {label: $phenotype})<-[:AFFECTS]-(f:Finding)
-            OPTIONAL MATCH (f)<-[:REPORTS]-(p:Paper)
-            OPTIONAL MATCH (f)-[:INVOLVES]->(o:Organism)
-            OPTIONAL MATCH (f)-[:OBSERVED_IN]->(t:Tissue)
-            RETURN f.direction AS direction,
-                   count(f) AS count,
-                   avg(f.evidence_strength) AS avg_evidence,
-                   avg(f.magnitude_value) AS avg_magnitude,
-                   collect(DISTINCT p.pmcid) AS papers,
-                   collect(DISTINCT o.label) AS organisms,
-                   collect(DISTINCT t.label) AS tissues
-            """
-
-            result = session.run(query, phenotype=phenotype)
-
-            findings_by_direction = {}
-            total_studies = 0
-            all_papers = set()
-
-            for record in result:
-                direction = record["direction"] or "unknown"
-                count = record["count"]
-                total_studies += count
-
-                findings_by_direction[direction] = {
-                    "count": count,
-                    "avg_evidence": record["avg_evidence"],
-                    "avg_magnitude": record["avg_magnitude"],
-                    "papers": [p for p in record["papers"] if p],
-                    "organisms": [o for o in record["organisms"] if o],
-                    "tissues": [t for t in record["tissues"] if t]
-                }
-
-                all_papers.update([p for p in record["papers"] if p])
-
-            # Calculate consensus score
-            if total_studies == 0:
-                raise HTTPException(status_code=404, detail=f"No findings for phenotype: {phenotype}")
-
-            # Find dominant direction
-            dominant_direction = max(findings_by_direction.items(), key=lambda x: x[1]["count"])
-            consensus_score = dominant_direction[1]["count"] / total_studies
-
-            return {
-                "phenotype": phenotype,
-                "total_findings": total_studies,
-                "unique_papers": len(all_papers),
-                "consensus_score": round(consensus_score, 3),
-                "dominant_direction": dominant_direction[0],
-                "findings_by_direction": findings_by_direction,
-                "interpretation": _interpret_consensus(consensus_score)
-            }
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error in consensus analysis for {phenotype}: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
-
-
-def _interpret_consensus(score: float) -> str:
-    """Interpret consensus score."""
-    if score >= 0.8:
-        return "Strong consensus"
-    elif score >= 0.6:
-        return "Moderate consensus"
-    elif score >= 0.4:
-        return "Weak consensus"
-    else:
-        return "No consensus (conflicting evidence)"
-
-
-@app.get("/kg/graph")
-async def get_knowledge_graph(
-    center_node: Optional[str] = Query(None, description="Center node ID (e.g., PMC12345)"),
-    node_type: Optional[str] = Query(None, description="Node type to start from (Paper, Organism, etc.)"),
-    depth: int = Query(2, description="Graph traversal depth", ge=1, le=3),
-    limit: int = Query(100, description="Maximum nodes to return", ge=1, le=500)
-):
-    """
-    Get knowledge graph for visualization.
-
-    Returns nodes and edges suitable for graph visualization libraries.
-    """
-    if neo4j_driver is None:
-        raise HTTPException(status_code=503, detail="Neo4j not connected")
-
-    try:
-        with get_neo4j_session() as session:
-            if center_node:
-                # Query from specific node - use uuid for Finding, pmcid for Paper, obo_id for others
-                query = f"""
-                MATCH path = (center)-[*1..{depth}]-(connected)
-                WHERE center.pmcid = $center_node OR center.obo_id = $center_node OR center.label = $center_node
-                WITH nodes(path) AS path_nodes, relationships(path) AS path_rels
-                UNWIND path_nodes AS n
-                UNWIND path_rels AS r
-                RETURN collect(DISTINCT {{
-                    id: coalesce(n.uuid, n.obo_id, n.pmcid, toString(id(n))),
-                    label: CASE labels(n)[0]
-                        WHEN 'Finding' THEN coalesce(n.direction, 'Finding')
-                        WHEN 'Phenotype' THEN
-                            CASE
-                                WHEN size(coalesce(n.label, 'Phenotype')) > 20
-                                THEN substring(coalesce(n.label, 'Phenotype'), 0, 17) + '...'
-                                ELSE coalesce(n.label, 'Phenotype')
-                            END
-                        WHEN 'Organism' THEN coalesce(n.label, 'Organism')
-                        WHEN 'Tissue' THEN coalesce(n.label, 'Tissue')
-                        WHEN 'Paper' THEN coalesce(n.pmcid, 'Paper')
-                        ELSE coalesce(n.label, n.pmcid, labels(n)[0])
-                    END,
-                    type: labels(n)[0],
-                    properties: properties(n)
-                }}) AS nodes,
-                collect(DISTINCT {{
-                    source: coalesce(startNode(r).uuid, startNode(r).obo_id, startNode(r).pmcid, toString(id(startNode(r)))),
-                    target: coalesce(endNode(r).uuid, endNode(r).obo_id, endNode(r).pmcid, toString(id(endNode(r)))),
-                    type: type(r),
-                    properties: properties(r)
-                }}) AS edges
-                LIMIT $limit
-                """
-                params = {"center_node": center_node, "limit": limit}
-            else:
-                # Get overview graph - simplified query that works with actual data
-                query = """
-                MATCH (p:Paper)-[r1:REPORTS]->(f:Finding)-[r2:AFFECTS]->(ph:Phenotype)
-                WITH p, f, ph, r1, r2
-                LIMIT $limit
-                RETURN collect(DISTINCT {
-                    id: coalesce(p.pmcid, id(p)),
-                    label: coalesce(p.pmcid, 'Paper'),
-                    type: 'Paper',
-                    properties: {pmcid: p.pmcid}
-                }) + collect(DISTINCT {
-                    id: coalesce(f.uuid, id(f)),
-                    label: coalesce(f.direction, 'Finding'),
-                    type: 'Finding',
-                    properties: {
-                        direction: f.direction,
-                        evidence_strength: f.evidence_strength
-                    }
-                }) + collect(DISTINCT {
-                    id: coalesce(ph.obo_id, id(ph)),
-                    label: CASE
-                        WHEN size(coalesce(ph.label, 'Phenotype')) > 20
-                        THEN substring(coalesce(ph.label, 'Phenotype'), 0, 17) + '...'
-                        ELSE coalesce(ph.label, 'Phenotype')
-                    END,
-                    type: 'Phenotype',
-                    properties: {obo_id: ph.obo_id, label: ph.label}
-                }) AS nodes,
-                collect(DISTINCT {
-                    source: coalesce(p.pmcid, id(p)),
-                    target: coalesce(f.uuid, id(f)),
-                    type: type(r1),
-                    properties: {}
-                }) + collect(DISTINCT {
-                    source: coalesce(f.uuid, id(f)),
-                    target: coalesce(ph.obo_id, id(ph)),
-                    type: type(r2),
-                    properties: {}
-                }) AS edges
-                """
-                params = {"limit": limit}
-
-            result = session.run(query, **params)
-            record = result.single()
-
-            if not record:
-                return {"nodes": [], "edges": []}
-
-            return {
-                "nodes": record["nodes"],
-                "edges": record["edges"],
-                "num_nodes": len(record["nodes"]),
-                "num_edges": len(record["edges"])
-            }
-
-    except Exception as e:
-        logger.error(f"Error fetching knowledge graph: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
-
-
-if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+"""
+FastAPI service for Space Biology Knowledge Graph.
+
+Provides endpoints for:
+- Health check
+- Semantic search over papers
+- Question answering with RAG
+- Knowledge graph queries
+"""
+
+import os
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from itertools import chain
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response
+from fastapi.concurrency import iterate_in_threadpool
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict
+from dotenv import load_dotenv
+
+try:
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    DefaultResponse = JSONResponse
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+try:
+    from api.rag_index import RAGIndex
+except ImportError:
+    RAGIndex = None
+
+try:
+    from neo4j import AsyncGraphDatabase, READ_ACCESS
+except ImportError:
+    AsyncGraphDatabase = None
+    READ_ACCESS = "READ"
+
+load_dotenv()
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Initialize FastAPI app
+app = FastAPI(
+    title="Space Biology Knowledge Graph API",
+    description="API for searching and querying space biology research papers",
+    version="1.0.0",
+    default_response_class=DefaultResponse
+)
+
+# CORS middleware
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],  # Configure appropriately for production
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+# Compress large JSON payloads (graph responses repeat labels/keys heavily).
+# Level 4 sits at the knee of the ratio/CPU curve for JSON. Brotli is used
+# instead when brotli-asgi is installed.
+try:
+    from brotli_asgi import BrotliMiddleware
+    app.add_middleware(BrotliMiddleware, minimum_size=1024, quality=4)
+except ImportError:
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=4)
+
+# Global RAG index
+rag_index: Optional[RAGIndex] = None
+
+# Global Neo4j driver
+neo4j_driver = None
+
+# Cached health status, refreshed by a background task so /health probes
+# (load balancers, k8s liveness checks) never trigger a full graph scan
+HEALTH_REFRESH_INTERVAL = float(os.getenv("HEALTH_REFRESH_INTERVAL", "30"))
+_neo4j_status = "disconnected"
+_neo4j_node_count = 0
+_health_task: Optional["asyncio.Task"] = None
+
+# Node-count queries in preference order: apoc.meta.stats is O(1) from the
+# count store, the full MATCH scan is the fallback when APOC is missing
+_NODE_COUNT_QUERIES = (
+    "CALL apoc.meta.stats() YIELD nodeCount RETURN nodeCount AS count",
+    "MATCH (n) RETURN count(n) AS count",
+)
+
+
+async def _refresh_neo4j_health():
+    """Periodically refresh the cached Neo4j status and node count."""
+    global _neo4j_status, _neo4j_node_count
+
+    while True:
+        if neo4j_driver is not None:
+            for query in _NODE_COUNT_QUERIES:
+                try:
+                    async with neo4j_driver.session() as session:
+                        result = await session.run(query)
+                        record = await result.single()
+                        _neo4j_node_count = record["count"]
+                        _neo4j_status = "connected"
+                    break
+                except Exception as e:
+                    _neo4j_status = f"error: {str(e)}"
+
+        await asyncio.sleep(HEALTH_REFRESH_INTERVAL)
+
+
+# Helper function to get Neo4j session
+def get_neo4j_session():
+    """Get an async Neo4j session (use as `async with get_neo4j_session() as session:`)."""
+    if neo4j_driver is None:
+        raise HTTPException(status_code=503, detail="Neo4j not connected")
+    return neo4j_driver.session()
+
+
+async def neo4j_session():
+    """
+    FastAPI dependency yielding one Neo4j session per request scope.
+
+    Sessions are opened in read mode so a cluster deployment can route
+    these queries to read replicas; all sub-queries of a request share the
+    same session instead of paying per-query BEGIN/COMMIT.
+    """
+    if neo4j_driver is None:
+        raise HTTPException(status_code=503, detail="Neo4j not connected")
+
+    async with neo4j_driver.session(default_access_mode=READ_ACCESS) as session:
+        yield session
+
+
+# Request/Response models
+class SearchRequest(BaseModel):
+    q: str
+    top_k: int = 5
+
+
+class AnswerRequest(BaseModel):
+    q: str
+    top_k: int = 5
+    model: str = "gpt-4"
+
+
+class ChunkSchema(BaseModel):
+    """A retrieved text chunk with its metadata."""
+    model_config = ConfigDict(from_attributes=True)
+
+    text: str
+    pmcid: str
+    section: str
+    offsets: Optional[Tuple[int, int]] = None
+    chunk_id: Optional[int] = None
+
+
+class SearchResultSchema(BaseModel):
+    """One search hit: a chunk plus its similarity score."""
+    model_config = ConfigDict(from_attributes=True)
+
+    chunk: ChunkSchema
+    score: float
+
+
+class AnswerSource(BaseModel):
+    """A source excerpt cited by a generated answer."""
+    pmcid: str
+    section: str
+    text: str
+    score: float
+
+
+class SearchResponse(BaseModel):
+    query: str
+    results: List[SearchResultSchema]
+    num_results: int
+
+
+class AnswerResponse(BaseModel):
+    question: str
+    answer: str
+    sources: List[AnswerSource]
+    num_sources: int
+
+
+class PapersBatchRequest(BaseModel):
+    pmcids: List[str]
+
+
+class Paper(BaseModel):
+    """Paper metadata as stored on the Neo4j node (extra properties ignored)."""
+    model_config = ConfigDict(extra="ignore")
+
+    pmcid: Optional[str] = None
+    title: Optional[str] = None
+    doi: Optional[str] = None
+    year: Optional[int] = None
+    journal: Optional[str] = None
+    authors: List[str] = []
+
+
+# Cypher for batched paper lookups (one round-trip for N pmcids)
+PAPERS_BATCH_QUERY = """
+MATCH (p:Paper)
+WHERE p.pmcid IN $pmcids
+OPTIONAL MATCH (p)-[:REPORTS]->(f:Finding)
+OPTIONAL MATCH (f)-[:AFFECTS]->(ph:Phenotype)
+OPTIONAL MATCH (f)-[:OBSERVED_IN]->(t:Tissue)
+OPTIONAL MATCH (f)-[:INVOLVES]->(o:Organism)
+RETURN p,
+       collect(DISTINCT {
+           finding_id: f.uuid,
+           direction: f.direction,
+           magnitude_value: f.magnitude_value,
+           magnitude_unit: f.magnitude_unit,
+           p_value: f.p_value,
+           evidence_strength: f.evidence_strength,
+           phenotype: ph.label,
+           tissue: t.label,
+           organism: o.label
+       }) AS findings
+"""
+
+
+# Indexes backing the gap-analysis filters (created at startup, idempotent)
+GAP_INDEX_STATEMENTS = (
+    "CREATE INDEX org_label IF NOT EXISTS FOR (o:Organism) ON (o.label)",
+    "CREATE INDEX tissue_label IF NOT EXISTS FOR (t:Tissue) ON (t.label)",
+    "CREATE INDEX exposure_type IF NOT EXISTS FOR (e:Exposure) ON (e.type)",
+    "CREATE INDEX duration_label IF NOT EXISTS FOR (d:Duration) ON (d.label)",
+)
+
+# Per-filter match clauses: (bitmask, unfiltered clause, filtered clause).
+# When a filter is supplied its match becomes mandatory with an index hint
+# so the planner seeks instead of scanning (verified with PROFILE).
+_GAP_MATCH_CLAUSES = (
+    (0b1000,
+     "OPTIONAL MATCH (exp)-[:INVOLVES]->(o:Organism)",
+     "MATCH (exp)-[:INVOLVES]->(o:Organism) USING INDEX o:Organism(label) WHERE o.label = $organism"),
+    (0b0100,
+     "OPTIONAL MATCH (exp)-[:INVOLVES]->(t:Tissue)",
+     "MATCH (exp)-[:INVOLVES]->(t:Tissue) USING INDEX t:Tissue(label) WHERE t.label = $tissue"),
+    (0b0010,
+     "OPTIONAL MATCH (exp)-[:APPLIES]->(e:Exposure)",
+     "MATCH (exp)-[:APPLIES]->(e:Exposure) USING INDEX e:Exposure(type) WHERE e.type = $exposure"),
+    (0b0001,
+     "OPTIONAL MATCH (exp)-[:HAS_DURATION]->(d:Duration)",
+     "MATCH (exp)-[:HAS_DURATION]->(d:Duration) USING INDEX d:Duration(label) WHERE d.label = $duration"),
+)
+
+_GAP_QUERY_TAIL = """
+WITH o.label AS organism,
+     t.label AS tissue,
+     e.type AS exposure,
+     d.label AS duration,
+     count(DISTINCT p) AS study_count,
+     avg(p.year) AS avg_year
+RETURN organism, tissue, exposure, duration, study_count, avg_year
+ORDER BY study_count DESC
+SKIP $offset
+LIMIT $limit
+"""
+
+
+def _build_gap_queries() -> Dict[int, str]:
+    """Precompile gap queries keyed by filter bitmask (organism<<3 | tissue<<2 | exposure<<1 | duration)."""
+    queries = {}
+    for mask in range(16):
+        lines = ["MATCH (p:Paper)-[:DESCRIBES]->(exp:Experiment)"]
+        for bit, unfiltered, filtered in _GAP_MATCH_CLAUSES:
+            lines.append(filtered if mask & bit else unfiltered)
+
+        queries[mask] = "\n".join(lines) + _GAP_QUERY_TAIL
+
+    return queries
+
+
+GAP_QUERIES = _build_gap_queries()
+
+CONSENSUS_QUERY = """
+MATCH (ph:Phenotype {label: $phenotype})<-[:AFFECTS]-(f:Finding)
+OPTIONAL MATCH (f)<-[:REPORTS]-(p:Paper)
+OPTIONAL MATCH (f)-[:INVOLVES]->(o:Organism)
+OPTIONAL MATCH (f)-[:OBSERVED_IN]->(t:Tissue)
+WITH f.direction AS direction,
+     count(f) AS count,
+     avg(f.evidence_strength) AS avg_evidence,
+     avg(f.magnitude_value) AS avg_magnitude,
+     collect(DISTINCT p.pmcid) AS papers,
+     collect(DISTINCT o.label) AS organisms,
+     collect(DISTINCT t.label) AS tissues
+WITH collect({
+    direction: direction,
+    count: count,
+    avg_evidence: avg_evidence,
+    avg_magnitude: avg_magnitude,
+    papers: papers,
+    organisms: organisms,
+    tissues: tissues
+}) AS buckets
+WITH buckets,
+     reduce(s = 0, b IN buckets | s + b.count) AS total,
+     reduce(m = 0, b IN buckets | CASE WHEN b.count > m THEN b.count ELSE m END) AS max_count
+RETURN buckets,
+       total,
+       head([b IN buckets WHERE b.count = max_count]) AS dominant
+"""
+
+# Row-based graph queries: one node/edge per row instead of giant
+# collect(DISTINCT {...}) maps, so results can be streamed and deduplicated
+# client-side as they arrive.
+GRAPH_CENTER_ROW_QUERIES = {
+    depth: f"""
+    MATCH path = (center)-[*1..{depth}]-(connected)
+    WHERE center.pmcid = $center_node OR center.obo_id = $center_node OR center.label = $center_node
+    WITH nodes(path) AS path_nodes, relationships(path) AS path_rels
+    LIMIT $limit
+    UNWIND path_nodes AS n
+    UNWIND path_rels AS r
+    RETURN coalesce(n.uuid, n.obo_id, n.pmcid, toString(id(n))) AS node_id,
+           labels(n)[0] AS node_type,
+           properties(n) AS node_props,
+           coalesce(startNode(r).uuid, startNode(r).obo_id, startNode(r).pmcid, toString(id(startNode(r)))) AS edge_source,
+           coalesce(endNode(r).uuid, endNode(r).obo_id, endNode(r).pmcid, toString(id(endNode(r)))) AS edge_target,
+           type(r) AS edge_type,
+           properties(r) AS edge_props
+    """
+    for depth in (1, 2, 3)
+}
+
+GRAPH_OVERVIEW_ROW_QUERY = """
+MATCH (p:Paper)-[r1:REPORTS]->(f:Finding)-[r2:AFFECTS]->(ph:Phenotype)
+WITH p, f, ph, r1, r2
+LIMIT $limit
+RETURN coalesce(p.pmcid, toString(id(p))) AS paper_id,
+       coalesce(f.uuid, toString(id(f))) AS finding_id,
+       f.direction AS finding_direction,
+       f.evidence_strength AS finding_evidence,
+       coalesce(ph.obo_id, toString(id(ph))) AS phenotype_id,
+       ph.label AS phenotype_label,
+       type(r1) AS r1_type,
+       type(r2) AS r2_type
+"""
+
+
+def _display_label(node_type: str, props: Dict[str, Any]) -> str:
+    """Compute a display label for a graph node (mirrors the old Cypher CASE)."""
+    if node_type == "Finding":
+        return props.get("direction") or "Finding"
+    if node_type == "Paper":
+        return props.get("pmcid") or "Paper"
+
+    label = props.get("label") or props.get("pmcid") or node_type
+    if node_type == "Phenotype" and len(label) > 20:
+        return label[:17] + "..."
+    return label
+
+
+def _center_row_elements(record):
+    """Extract (kind, payload, dedup_key) elements from a center-graph row."""
+    node_type = record["node_type"]
+    props = record["node_props"]
+    yield "node", {
+        "id": record["node_id"],
+        "label": _display_label(node_type, props),
+        "type": node_type,
+        "properties": props
+    }, record["node_id"]
+
+    edge_key = (record["edge_source"], record["edge_target"], record["edge_type"])
+    yield "edge", {
+        "source": record["edge_source"],
+        "target": record["edge_target"],
+        "type": record["edge_type"],
+        "properties": record["edge_props"]
+    }, edge_key
+
+
+def _overview_row_elements(record):
+    """Extract (kind, payload, dedup_key) elements from an overview row."""
+    paper_id = record["paper_id"]
+    finding_id = record["finding_id"]
+    phenotype_id = record["phenotype_id"]
+    phenotype_label = record["phenotype_label"]
+
+    yield "node", {
+        "id": paper_id,
+        "label": paper_id or "Paper",
+        "type": "Paper",
+        "properties": {"pmcid": record["paper_id"]}
+    }, paper_id
+
+    yield "node", {
+        "id": finding_id,
+        "label": record["finding_direction"] or "Finding",
+        "type": "Finding",
+        "properties": {
+            "direction": record["finding_direction"],
+            "evidence_strength": record["finding_evidence"]
+        }
+    }, finding_id
+
+    yield "node", {
+        "id": phenotype_id,
+        "label": _display_label("Phenotype", {"label": phenotype_label}),
+        "type": "Phenotype",
+        "properties": {"obo_id": phenotype_id, "label": phenotype_label}
+    }, phenotype_id
+
+    yield "edge", {
+        "source": paper_id,
+        "target": finding_id,
+        "type": record["r1_type"],
+        "properties": {}
+    }, (paper_id, finding_id, record["r1_type"])
+
+    yield "edge", {
+        "source": finding_id,
+        "target": phenotype_id,
+        "type": record["r2_type"],
+        "properties": {}
+    }, (finding_id, phenotype_id, record["r2_type"])
+
+
+async def _iter_graph_elements(session, query: str, params: Dict[str, Any], row_elements):
+    """Yield deduplicated ('node'|'edge', payload) pairs from a row-based query."""
+    seen_nodes = set()
+    seen_edges = set()
+
+    result = await session.run(query, **params)
+    async for record in result:
+        for kind, payload, key in row_elements(record):
+            seen = seen_nodes if kind == "node" else seen_edges
+            if key in seen:
+                continue
+            seen.add(key)
+            yield kind, payload
+
+
+def _format_paper(record) -> Dict[str, Any]:
+    """Build the /papers response payload from a paper record."""
+    paper = Paper.model_validate(dict(record["p"]))
+    findings = [f for f in record["findings"] if f.get("finding_id")]
+
+    return {
+        **paper.model_dump(),
+        "findings": findings,
+        "num_findings": len(findings)
+    }
+
+
+class PaperLoader:
+    """
+    DataLoader-style coalescer for paper lookups.
+
+    Concurrent `load(pmcid)` calls within a short window are collapsed into
+    a single `WHERE p.pmcid IN $pmcids` Cypher round-trip, amortizing query
+    planning and Bolt overhead across the burst.
+    """
+
+    def __init__(self, batch_window: float = 0.005):
+        self.batch_window = batch_window
+        self._pending: Dict[str, "asyncio.Future"] = {}
+        self._dispatch_task: Optional["asyncio.Task"] = None
+
+    async def load(self, pmcid: str) -> Optional[Dict[str, Any]]:
+        """Get a paper payload by pmcid, or None if not found."""
+        future = self._pending.get(pmcid)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[pmcid] = future
+            if self._dispatch_task is None or self._dispatch_task.done():
+                self._dispatch_task = asyncio.create_task(self._dispatch())
+        return await future
+
+    async def _dispatch(self):
+        """Wait out the batch window, then resolve all pending loads at once."""
+        await asyncio.sleep(self.batch_window)
+        pending, self._pending = self._pending, {}
+        # Hand the batch off without holding the dispatch slot: loads
+        # arriving during the Cypher round-trip see a finished task and
+        # schedule the next dispatch rather than hanging on their futures
+        asyncio.create_task(self._resolve_batch(pending))
+
+    async def _resolve_batch(self, pending: Dict[str, "asyncio.Future"]):
+        """Fetch one swapped-out batch and settle its futures."""
+        try:
+            papers = await self._fetch_batch(list(pending.keys()))
+            for pmcid, future in pending.items():
+                if not future.done():
+                    future.set_result(papers.get(pmcid))
+        except Exception as e:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(e)
+
+    async def _fetch_batch(self, pmcids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch a batch of papers in one Cypher query, keyed by pmcid."""
+        papers = {}
+        async with get_neo4j_session() as session:
+            result = await session.run(PAPERS_BATCH_QUERY, pmcids=pmcids)
+            async for record in result:
+                payload = _format_paper(record)
+                papers[payload["pmcid"]] = payload
+        return papers
+
+
+paper_loader = PaperLoader()
+
+
+class SearchBatcher:
+    """
+    Micro-batcher for FAISS searches.
+
+    Concurrent /search requests within a short window are stacked into a
+    single encoder + index.search call, which amortizes model overhead and
+    keeps GPU indexes fed with full batches. The window and batch ceiling
+    are tunable via SEARCH_BATCH_WINDOW (seconds, default 0.005) and
+    SEARCH_BATCH_MAX (default 32).
+    """
+
+    def __init__(self, batch_window: float = 0.005, max_batch: int = 32):
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self._pending: List[Tuple[str, int, "asyncio.Future"]] = []
+        self._dispatch_task: Optional["asyncio.Task"] = None
+
+    async def search(self, query: str, top_k: int):
+        """Search via the shared batch; returns this query's results."""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((query, top_k, future))
+
+        if len(self._pending) >= self.max_batch:
+            batch, self._pending = self._pending, []
+            asyncio.create_task(self._run_batch(batch))
+        elif self._dispatch_task is None or self._dispatch_task.done():
+            self._dispatch_task = asyncio.create_task(self._dispatch())
+
+        return await future
+
+    async def _dispatch(self):
+        """Wait out the batch window, then run whatever has accumulated."""
+        await asyncio.sleep(self.batch_window)
+        batch, self._pending = self._pending, []
+        # Hand the batch off without holding the dispatch slot: requests
+        # arriving while it runs see a finished task and can schedule the
+        # next dispatch, instead of waiting on a future nothing resolves
+        asyncio.create_task(self._run_batch(batch))
+
+    async def _run_batch(self, batch):
+        if not batch:
+            return
+
+        queries = [query for query, _, _ in batch]
+        max_k = max(top_k for _, top_k, _ in batch)
+
+        try:
+            batch_results = await asyncio.to_thread(
+                rag_index.search_batch, queries, max_k
+            )
+            for (_, top_k, future), results in zip(batch, batch_results):
+                if not future.done():
+                    future.set_result(results[:top_k])
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+
+
+search_batcher = SearchBatcher(
+    batch_window=float(os.getenv("SEARCH_BATCH_WINDOW", "0.005")),
+    max_batch=int(os.getenv("SEARCH_BATCH_MAX", "32"))
+)
+
+
+class TTLCache:
+    """
+    Small in-process TTL cache with ETag support.
+
+    Used to memoize expensive aggregation endpoints (/kg/gap, /kg/consensus)
+    whose underlying graph is essentially append-only; cache hits skip the
+    Cypher execution entirely and conditional requests get a 304.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: Dict[Any, Tuple[float, str, Any]] = {}
+        self._locks: Dict[Any, asyncio.Lock] = {}
+
+    def get(self, key) -> Optional[Tuple[Any, str]]:
+        """Return (payload, etag) if cached and fresh, else None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires, etag, payload = entry
+        if time.monotonic() >= expires:
+            self._entries.pop(key, None)
+            return None
+
+        return payload, etag
+
+    def set(self, key, payload) -> str:
+        """Cache a payload and return its ETag."""
+        if len(self._entries) >= self.maxsize:
+            # Evict the oldest entry (dicts preserve insertion order)
+            self._entries.pop(next(iter(self._entries)), None)
+
+        digest = hashlib.sha1(
+            json.dumps(payload, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        etag = f'"{digest}"'
+        self._entries[key] = (time.monotonic() + self.ttl, etag, payload)
+        return etag
+
+    def lock(self, key) -> asyncio.Lock:
+        """Per-key lock so concurrent misses compute the payload only once."""
+        lock = self._locks.get(key)
+        if lock is None:
+            if len(self._locks) >= self.maxsize:
+                # Bound the lock table like the entry cache: keys include
+                # user-controlled filter strings, so it must not grow
+                # without limit. Evicting the oldest lock at worst lets
+                # two concurrent misses compute the same payload once.
+                self._locks.pop(next(iter(self._locks)), None)
+            lock = self._locks.setdefault(key, asyncio.Lock())
+        return lock
+
+
+kg_cache = TTLCache(maxsize=1024, ttl=float(os.getenv("KG_CACHE_TTL", "300")))
+
+
+def _cache_headers(etag: str) -> Dict[str, str]:
+    """HTTP caching headers for a cached payload."""
+    return {"ETag": etag, "Cache-Control": f"max-age={int(kg_cache.ttl)}"}
+
+
+def _cached_response(cached: Tuple[Any, str], request: Request):
+    """Serve a cache hit, honoring If-None-Match."""
+    payload, etag = cached
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+
+    return DefaultResponse(payload, headers=_cache_headers(etag))
+
+
+@app.on_event("startup")
+async def startup_event():
+    """Initialize RAG index and Neo4j connection on startup."""
+    global rag_index, neo4j_driver, _health_task
+
+    # Initialize RAG index
+    index_path = Path(os.getenv("RAG_INDEX_PATH", "data/rag/index.faiss"))
+
+    if RAGIndex is None:
+        logger.warning("RAGIndex not available. Search endpoints will not work.")
+    else:
+        if index_path.exists():
+            try:
+                logger.info(f"Loading RAG index from {index_path}")
+                rag_index = RAGIndex(index_path=index_path)
+                logger.info(f"RAG index loaded with {len(rag_index.chunks)} chunks")
+                # Serve FAISS searches from GPU when one is available
+                rag_index.to_gpu()
+                # Warm the embedder and touch the index so the first real
+                # /search request doesn't pay the lazy-load cost
+                warmup_start = time.perf_counter()
+                await asyncio.to_thread(rag_index.search, "warmup", 1)
+                logger.info(f"RAG warmup took {time.perf_counter() - warmup_start:.2f}s")
+            except Exception as e:
+                logger.error(f"Failed to load RAG index: {e}")
+                rag_index = None
+        else:
+            logger.warning(f"RAG index not found at {index_path}. Build it first with: python -m api.rag_index")
+
+    # Initialize Neo4j connection
+    if AsyncGraphDatabase is None:
+        logger.warning("Neo4j driver not available. Graph endpoints will not work.")
+    else:
+        neo4j_uri = os.getenv("NEO4J_URI", "bolt://localhost:7687")
+        neo4j_user = os.getenv("NEO4J_USER", "neo4j")
+        neo4j_password = os.getenv("NEO4J_PASSWORD", "spacebio123")
+
+        try:
+            logger.info(f"Connecting to Neo4j at {neo4j_uri}")
+            neo4j_driver = AsyncGraphDatabase.driver(
+                neo4j_uri,
+                auth=(neo4j_user, neo4j_password),
+                max_connection_pool_size=int(os.getenv("NEO4J_POOL_SIZE", "50")),
+                connection_acquisition_timeout=float(os.getenv("NEO4J_ACQ_TIMEOUT", "30"))
+            )
+            # Test connection
+            async with neo4j_driver.session() as session:
+                result = await session.run("RETURN 1 AS test")
+                await result.single()
+            logger.info("Neo4j connection successful")
+
+            # Prefill part of the connection pool so early requests don't
+            # block on lazy connection acquisition
+            warmup_start = time.perf_counter()
+            pool_warmers = max(1, int(os.getenv("NEO4J_POOL_SIZE", "50")) // 4)
+            await asyncio.gather(
+                *[neo4j_driver.verify_connectivity() for _ in range(pool_warmers)],
+                return_exceptions=True
+            )
+            logger.info(f"Neo4j pool warmup took {time.perf_counter() - warmup_start:.2f}s")
+
+            # Ensure the indexes backing gap-analysis filters exist
+            async with neo4j_driver.session() as session:
+                for stmt in GAP_INDEX_STATEMENTS:
+                    try:
+                        await session.run(stmt)
+                    except Exception as e:
+                        logger.warning(f"Could not create index: {e}")
+        except Exception as e:
+            logger.error(f"Failed to connect to Neo4j: {e}")
+            neo4j_driver = None
+
+    # Keep the /health payload fresh without per-probe graph scans
+    _health_task = asyncio.create_task(_refresh_neo4j_health())
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close Neo4j connection on shutdown."""
+    global neo4j_driver
+    if _health_task is not None:
+        _health_task.cancel()
+    if neo4j_driver is not None:
+        try:
+            await neo4j_driver.close()
+            logger.info("Neo4j connection closed")
+        except Exception as e:
+            logger.error(f"Error closing Neo4j connection: {e}")
+
+
+@app.get("/")
+async def root():
+    """Root endpoint."""
+    return {
+        "message": "Space Biology Knowledge Graph API",
+        "version": "1.0.0",
+        "endpoints": {
+            "health": "GET /health - Health check and status",
+            "search": "POST /search - Semantic search over papers",
+            "answer": "POST /answer - Question answering with RAG",
+            "papers": "GET /papers/{pmcid} - Get paper details",
+            "gap": "GET /kg/gap - Knowledge gap analysis",
+            "consensus": "GET /kg/consensus?phenotype={name} - Consensus analysis",
+            "graph": "GET /kg/graph - Knowledge graph visualization"
+        }
+    }
+
+
+@app.get("/health")
+async def health():
+    """Health check endpoint (serves cached Neo4j status, no DB call)."""
+    return {
+        "status": "healthy",
+        "rag_index_loaded": rag_index is not None,
+        "num_chunks": len(rag_index.chunks) if rag_index else 0,
+        "neo4j_status": _neo4j_status,
+        "neo4j_node_count": _neo4j_node_count
+    }
+
+
+@app.post("/search", response_model=SearchResponse)
+async def search(request: SearchRequest):
+    """
+    Semantic search over paper paragraphs.
+
+    Returns top-k most similar chunks with metadata.
+    """
+    if rag_index is None:
+        raise HTTPException(status_code=503, detail="RAG index not available")
+
+    try:
+        # Concurrent searches are micro-batched into one FAISS call, which
+        # runs in a worker thread so it doesn't block the event loop.
+        results = await search_batcher.search(request.q, request.top_k)
+
+        return SearchResponse(
+            query=request.q,
+            results=results,
+            num_results=len(results)
+        )
+
+    except Exception as e:
+        logger.error(f"Search error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/answer", response_model=AnswerResponse)
+async def answer(request: AnswerRequest):
+    """
+    Answer a question using RAG.
+
+    Retrieves relevant chunks and synthesizes an answer with LLM.
+    """
+    if rag_index is None:
+        raise HTTPException(status_code=503, detail="RAG index not available")
+
+    try:
+        # Retrieval rides the shared search micro-batch; only the LLM call
+        # is per-request, dispatched to a worker thread so concurrent
+        # completions run in parallel.
+        results = await search_batcher.search(request.q, request.top_k)
+        result = await asyncio.to_thread(
+            rag_index.answer_from_results,
+            request.q,
+            results,
+            model=request.model
+        )
+
+        return AnswerResponse(**result)
+
+    except Exception as e:
+        logger.error(f"Answer error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.get("/answer/stream")
+async def answer_stream(
+    q: str = Query(..., description="Question to answer"),
+    top_k: int = Query(5, description="Number of chunks to retrieve"),
+    model: str = Query("gpt-4", description="LLM model to use")
+):
+    """
+    Answer a question using RAG, streaming tokens as server-sent events.
+
+    Emits `{"delta": ...}` events as the LLM produces tokens, then a final
+    `{"sources": ...}` event and `[DONE]`.
+    """
+    if rag_index is None:
+        raise HTTPException(status_code=503, detail="RAG index not available")
+
+    results = await search_batcher.search(q, top_k)
+    prompt, sources = rag_index.build_prompt(q, results)
+
+    async def generate():
+        if results:
+            deltas = rag_index.stream_llm_answer(prompt, model=model)
+            async for delta in iterate_in_threadpool(deltas):
+                yield b"data: " + _dumps({"delta": delta}) + b"\n\n"
+        else:
+            yield b"data: " + _dumps({"delta": "No relevant information found."}) + b"\n\n"
+
+        yield b"data: " + _dumps({"sources": sources, "num_sources": len(sources)}) + b"\n\n"
+        yield b"data: [DONE]\n\n"
+
+    return StreamingResponse(generate(), media_type="text/event-stream")
+
+
+@app.get("/search")
+async def search_get(
+    q: str = Query(..., description="Search query"),
+    top_k: int = Query(5, description="Number of results")
+):
+    """GET version of search endpoint for convenience."""
+    return await search(SearchRequest(q=q, top_k=top_k))
+
+
+@app.get("/answer")
+async def answer_get(
+    q: str = Query(..., description="Question to answer"),
+    top_k: int = Query(5, description="Number of chunks to retrieve"),
+    model: str = Query("gpt-4", description="LLM model to use")
+):
+    """GET version of answer endpoint for convenience."""
+    return await answer(AnswerRequest(q=q, top_k=top_k, model=model))
+
+
+# Neo4j-powered endpoints
+@app.get("/papers/{pmcid}")
+async def get_paper(pmcid: str):
+    """
+    Get paper metadata and findings by PMCID.
+
+    Returns:
+        Paper metadata with associated experiments and findings
+    """
+    if neo4j_driver is None:
+        raise HTTPException(status_code=503, detail="Neo4j not connected")
+
+    try:
+        paper = await paper_loader.load(pmcid)
+
+        if paper is None:
+            raise HTTPException(status_code=404, detail=f"Paper {pmcid} not found")
+
+        return paper
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error fetching paper {pmcid}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/papers:batch")
+async def get_papers_batch(request: PapersBatchRequest):
+    """
+    Get multiple papers by PMCID in a single request.
+
+    Returns:
+        Mapping of pmcid to paper payload (missing papers map to null)
+    """
+    if neo4j_driver is None:
+        raise HTTPException(status_code=503, detail="Neo4j not connected")
+
+    try:
+        results = await asyncio.gather(*(paper_loader.load(p) for p in request.pmcids))
+        return {
+            "papers": dict(zip(request.pmcids, results)),
+            "num_found": sum(1 for r in results if r is not None)
+        }
+
+    except Exception as e:
+        logger.error(f"Error fetching paper batch: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.get("/kg/gap", response_model=None)
+async def knowledge_gap(
+    request: Request,
+    organism: Optional[str] = Query(None, description="Filter by organism label"),
+    tissue: Optional[str] = Query(None, description="Filter by tissue label"),
+    exposure: Optional[str] = Query(None, description="Filter by exposure type"),
+    duration: Optional[str] = Query(None, description="Filter by duration"),
+    offset: int = Query(0, description="Number of combinations to skip", ge=0),
+    limit: int = Query(1000, description="Maximum combinations to return", ge=1, le=1000),
+    session=Depends(neo4j_session)
+):
+    """
+    Query knowledge gaps in the graph.
+
+    Returns a matrix showing combinations of organism × tissue × exposure × duration
+    with study counts for gap analysis. Results are paged server-side via
+    offset/limit, cached with a TTL, and served conditionally via ETag.
+    """
+    cache_key = ("gap", organism, tissue, exposure, duration, offset, limit)
+    cached = kg_cache.get(cache_key)
+    if cached is not None:
+        return _cached_response(cached, request)
+
+    try:
+        async with kg_cache.lock(cache_key):
+            # Another request may have populated the cache while we waited
+            cached = kg_cache.get(cache_key)
+            if cached is not None:
+                return _cached_response(cached, request)
+
+            payload = await _compute_knowledge_gap(
+                session, organism, tissue, exposure, duration, offset, limit
+            )
+            etag = kg_cache.set(cache_key, payload)
+
+        return DefaultResponse(payload, headers=_cache_headers(etag))
+
+    except Exception as e:
+        logger.error(f"Error in gap analysis: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+async def _compute_knowledge_gap(
+    session,
+    organism: Optional[str],
+    tissue: Optional[str],
+    exposure: Optional[str],
+    duration: Optional[str],
+    offset: int = 0,
+    limit: int = 1000
+) -> Dict[str, Any]:
+    """Run the gap-analysis Cypher and build the response payload."""
+    # Select the precompiled query for this filter combination
+    mask = 0
+    params = {"offset": offset, "limit": limit}
+
+    if organism:
+        mask |= 0b1000
+        params["organism"] = organism
+    if tissue:
+        mask |= 0b0100
+        params["tissue"] = tissue
+    if exposure:
+        mask |= 0b0010
+        params["exposure"] = exposure
+    if duration:
+        mask |= 0b0001
+        params["duration"] = duration
+
+    result = await session.run(GAP_QUERIES[mask], **params)
+
+    gaps = [
+        {
+            "organism": record["organism"],
+            "tissue": record["tissue"],
+            "exposure": record["exposure"],
+            "duration": record["duration"],
+            "study_count": record["study_count"],
+            "avg_year": int(record["avg_year"]) if record["avg_year"] else None
+        }
+        async for record in result
+    ]
+
+    return {
+        "filters": {
+            "organism": organism,
+            "tissue": tissue,
+            "exposure": exposure,
+            "duration": duration
+        },
+        "offset": offset,
+        "limit": limit,
+        "gaps": gaps,
+        "num_combinations": len(gaps)
+    }
+
+
+@app.get("/kg/consensus", response_model=None)
+async def consensus_analysis(
+    request: Request,
+    phenotype: str = Query(..., description="Phenotype label to analyze"),
+    session=Depends(neo4j_session)
+):
+    """
+    Analyze consensus/disagreement on a phenotype.
+
+    Returns:
+        - Total studies analyzing this phenotype
+        - Distribution of findings by direction (increase/decrease/no_change)
+        - Agreement score
+        - Confidence bands
+
+    Results are cached with a TTL and served conditionally via ETag.
+    """
+    cache_key = ("consensus", phenotype)
+    cached = kg_cache.get(cache_key)
+    if cached is not None:
+        return _cached_response(cached, request)
+
+    try:
+        async with kg_cache.lock(cache_key):
+            # Another request may have populated the cache while we waited
+            cached = kg_cache.get(cache_key)
+            if cached is not None:
+                return _cached_response(cached, request)
+
+            payload = await _compute_consensus(session, phenotype)
+            etag = kg_cache.set(cache_key, payload)
+
+        return DefaultResponse(payload, headers=_cache_headers(etag))
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error in consensus analysis for {phenotype}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+async def _compute_consensus(session, phenotype: str) -> Dict[str, Any]:
+    """Run the consensus Cypher and build the response payload."""
+    result = await session.run(CONSENSUS_QUERY, phenotype=phenotype)
+    record = await result.single()
+
+    if not record or not record["buckets"] or not record["total"]:
+        raise HTTPException(status_code=404, detail=f"No findings for phenotype: {phenotype}")
+
+    # Totals and the dominant direction are computed in Cypher; Python just
+    # reshapes the buckets
+    total_studies = record["total"]
+    dominant = record["dominant"]
+
+    findings_by_direction = {}
+
+    for bucket in record["buckets"]:
+        direction = bucket["direction"] or "unknown"
+        papers = [p for p in bucket["papers"] if p]
+
+        findings_by_direction[direction] = {
+            "count": bucket["count"],
+            "avg_evidence": bucket["avg_evidence"],
+            "avg_magnitude": bucket["avg_magnitude"],
+            "papers": papers,
+            "organisms": [o for o in bucket["organisms"] if o],
+            "tissues": [t for t in bucket["tissues"] if t]
+        }
+
+    all_papers = frozenset(chain.from_iterable(
+        info["papers"] for info in findings_by_direction.values()
+    ))
+
+    consensus_score = dominant["count"] / total_studies
+
+    return {
+        "phenotype": phenotype,
+        "total_findings": total_studies,
+        "unique_papers": len(all_papers),
+        "consensus_score": round(consensus_score, 3),
+        "dominant_direction": dominant["direction"] or "unknown",
+        "findings_by_direction": findings_by_direction,
+        "interpretation": _interpret_consensus(consensus_score)
+    }
+
+
+def _interpret_consensus(score: float) -> str:
+    """Interpret consensus score."""
+    if score >= 0.8:
+        return "Strong consensus"
+    elif score >= 0.6:
+        return "Moderate consensus"
+    elif score >= 0.4:
+        return "Weak consensus"
+    else:
+        return "No consensus (conflicting evidence)"
+
+
+@app.get("/kg/graph", response_model=None)
+async def get_knowledge_graph(
+    center_node: Optional[str] = Query(None, description="Center node ID (e.g., PMC12345)"),
+    node_type: Optional[str] = Query(None, description="Node type to start from (Paper, Organism, etc.)"),
+    depth: int = Query(2, description="Graph traversal depth", ge=1, le=3),
+    limit: int = Query(100, description="Maximum nodes to return", ge=1, le=500),
+    stream: bool = Query(False, description="Stream results as NDJSON instead of a single JSON object"),
+    session=Depends(neo4j_session)
+):
+    """
+    Get knowledge graph for visualization.
+
+    Returns nodes and edges suitable for graph visualization libraries.
+    With stream=true, emits one NDJSON record per node/edge as results
+    arrive from Neo4j instead of materializing the whole payload.
+    """
+    if center_node:
+        # Query from specific node - use uuid for Finding, pmcid for Paper, obo_id for others
+        query = GRAPH_CENTER_ROW_QUERIES[depth]
+        params = {"center_node": center_node, "limit": limit}
+        row_elements = _center_row_elements
+    else:
+        # Get overview graph - simplified query that works with actual data
+        query = GRAPH_OVERVIEW_ROW_QUERY
+        params = {"limit": limit}
+        row_elements = _overview_row_elements
+
+    if stream:
+        async def generate():
+            async for kind, payload in _iter_graph_elements(session, query, params, row_elements):
+                yield _dumps({"kind": kind, **payload}) + b"\n"
+
+        return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+    try:
+        nodes = []
+        edges = []
+        async for kind, payload in _iter_graph_elements(session, query, params, row_elements):
+            (nodes if kind == "node" else edges).append(payload)
+
+        # Pre-built response skips jsonable_encoder on the large payload
+        return DefaultResponse({
+            "nodes": nodes,
+            "edges": edges,
+            "num_nodes": len(nodes),
+            "num_edges": len(edges)
+        })
+
+    except Exception as e:
+        logger.error(f"Error fetching knowledge graph: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+if __name__ == "__main__":
+    import uvicorn
+    uvicorn.run(
+        "api.main:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=int(os.getenv("WORKERS", (os.cpu_count() or 1) * 2)),
+        loop="uvloop",
+        http="httptools",
+        log_level="info"
+    )
@@ -13,20 +13,58 @@ Features:
 - API endpoints: /search and /answer
 """
 
+import concurrent.futures
+import hashlib
 import os
 import json
 import logging
 import pickle
+import re
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
+
+# Must be set before OpenMP-linked libraries (faiss, torch) initialize.
+# Half the cores leaves headroom for the server event loop and avoids
+# oversubscription when several uvicorn workers share the machine.
+os.environ.setdefault("OMP_NUM_THREADS", str(max(1, (os.cpu_count() or 2) // 2)))
+
 import numpy as np
 
 try:
     import faiss
+
+    # FAISS parallelizes scans across the query axis; cap its OpenMP pool
+    # so it doesn't fight the encoder threads for cores
+    try:
+        faiss.omp_set_num_threads(min(8, os.cpu_count() or 1))
+    except AttributeError:
+        pass
 except ImportError:
     faiss = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import torch
+
+    # PyTorch's intra-op pool can default to a single thread; size it
+    # explicitly (RAG_NUM_THREADS env var) and keep inter-op at 1 so the
+    # encoder and OpenMP pools don't thrash each other
+    torch.set_num_threads(
+        int(os.getenv("RAG_NUM_THREADS", max(1, (os.cpu_count() or 2) // 2)))
+    )
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # Raises once parallel work has already started in this process
+        pass
+except ImportError:
+    torch = None
+
 try:
     from sentence_transformers import SentenceTransformer
 except ImportError:
@@ -37,12 +75,42 @@ try:
 except ImportError:
     OpenAI = None
 
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
 from dotenv import load_dotenv
 
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Paragraph separator: one or more blank lines
+_PARA_RE = re.compile(r'\n{2,}')
+
+# Shared OpenAI client; building one per call would redo the TCP+TLS
+# handshake and connection pool setup on every question
+_openai_client = None
+
+
+def _get_openai_client() -> "OpenAI":
+    """Return the process-wide OpenAI client, creating it on first use."""
+    global _openai_client
+    if _openai_client is None:
+        http_client = None
+        if httpx is not None:
+            try:
+                http_client = httpx.Client(
+                    http2=True,
+                    limits=httpx.Limits(max_connections=32, max_keepalive_connections=16)
+                )
+            except ImportError:
+                # http2 needs the h2 package; the SDK default pool still reuses connections
+                pass
+        _openai_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"), http_client=http_client)
+    return _openai_client
+
 
 @dataclass
 class Chunk:
@@ -54,7 +122,14 @@ class Chunk:
     chunk_id: Optional[int] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Hand-written literal; asdict() deep-copies every field
+        return {
+            'text': self.text,
+            'pmcid': self.pmcid,
+            'section': self.section,
+            'offsets': self.offsets,
+            'chunk_id': self.chunk_id
+        }
 
 
 @dataclass
@@ -70,6 +145,171 @@ class SearchResult:
         }
 
 
+class _ChunkStore:
+    """
+    Lazy Struct-of-Arrays view over chunk metadata loaded from disk.
+
+    Keeps pmcids/sections as dictionary-encoded code arrays and texts as a
+    single byte blob with an offsets array, materializing a Chunk object
+    only when it is actually retrieved. Newly added chunks live in a plain
+    overflow list so add_chunks keeps working on a loaded index.
+    """
+
+    def __init__(self, data):
+        self._text_blob = data['text_blob']
+        self._text_end = data['text_end']
+        self._pmcid_codes = data['pmcid_codes']
+        self._pmcid_vocab = [str(v) for v in data['pmcid_vocab']]
+        self._section_codes = data['section_codes']
+        self._section_vocab = [str(v) for v in data['section_vocab']]
+        self._off_start = data['off_start']
+        self._off_end = data['off_end']
+        self._base_len = int(len(self._text_end))
+        self._extra: List[Chunk] = []
+
+    def __len__(self) -> int:
+        return self._base_len + len(self._extra)
+
+    def __getitem__(self, i: int) -> Chunk:
+        if i < 0:
+            i += len(self)
+        if i >= self._base_len:
+            return self._extra[i - self._base_len]
+
+        start = 0 if i == 0 else int(self._text_end[i - 1])
+        end = int(self._text_end[i])
+        off_start = int(self._off_start[i])
+
+        return Chunk(
+            text=bytes(self._text_blob[start:end]).decode('utf-8'),
+            pmcid=self._pmcid_vocab[int(self._pmcid_codes[i])],
+            section=self._section_vocab[int(self._section_codes[i])],
+            offsets=None if off_start < 0 else (off_start, int(self._off_end[i])),
+            chunk_id=i
+        )
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def extend(self, chunks: List[Chunk]):
+        self._extra.extend(chunks)
+
+
+def _chunks_to_arrays(chunks) -> Dict[str, np.ndarray]:
+    """Convert chunks to the Struct-of-Arrays layout used on disk."""
+    text_lengths = []
+    text_parts = []
+    pmcid_vocab: Dict[str, int] = {}
+    pmcid_codes = []
+    section_vocab: Dict[str, int] = {}
+    section_codes = []
+    off_start = []
+    off_end = []
+
+    for chunk in chunks:
+        encoded = chunk.text.encode('utf-8')
+        text_parts.append(encoded)
+        text_lengths.append(len(encoded))
+        pmcid_codes.append(pmcid_vocab.setdefault(chunk.pmcid, len(pmcid_vocab)))
+        section_codes.append(section_vocab.setdefault(chunk.section, len(section_vocab)))
+        if chunk.offsets is None:
+            off_start.append(-1)
+            off_end.append(-1)
+        else:
+            off_start.append(chunk.offsets[0])
+            off_end.append(chunk.offsets[1])
+
+    return {
+        'text_blob': np.frombuffer(b''.join(text_parts), dtype=np.uint8),
+        'text_end': np.cumsum(text_lengths, dtype=np.int64),
+        'pmcid_codes': np.array(pmcid_codes, dtype=np.int32),
+        'pmcid_vocab': np.array(list(pmcid_vocab), dtype=str),
+        'section_codes': np.array(section_codes, dtype=np.uint8),
+        'section_vocab': np.array(list(section_vocab), dtype=str),
+        'off_start': np.array(off_start, dtype=np.int32),
+        'off_end': np.array(off_end, dtype=np.int32),
+    }
+
+
+def _chunk_paper_sections(
+    sections: Dict[str, str],
+    pmcid: str,
+    max_chunk_size: int = 500,
+    overlap: int = 50
+) -> List[Chunk]:
+    """
+    Chunk paper sections into paragraphs.
+
+    Module-level so process-pool workers can run it without pickling the
+    index object.
+
+    Args:
+        sections: Dict with section names as keys and text as values
+        pmcid: Paper PMCID
+        max_chunk_size: Maximum characters per chunk
+        overlap: Character overlap between chunks
+
+    Returns:
+        List of Chunk objects
+    """
+    chunks = []
+    step = max_chunk_size - overlap
+
+    # Prioritize Results > Discussion > Conclusion
+    section_priority = ['results', 'discussion', 'conclusion', 'abstract']
+
+    for section_name in section_priority:
+        section_text = sections.get(section_name, '')
+        if not section_text:
+            continue
+
+        # Split by paragraphs (one or more blank lines)
+        paragraphs = [p for p in (s.strip() for s in _PARA_RE.split(section_text)) if p]
+
+        for para in paragraphs:
+            # Further split if paragraph is too long
+            if len(para) <= max_chunk_size:
+                chunks.append(Chunk(
+                    text=para,
+                    pmcid=pmcid,
+                    section=section_name,
+                    offsets=None
+                ))
+            else:
+                # Emit all overlapping windows in one pass
+                chunks.extend(
+                    Chunk(
+                        text=para[start:start + max_chunk_size],
+                        pmcid=pmcid,
+                        section=section_name,
+                        offsets=(start, min(start + max_chunk_size, len(para)))
+                    )
+                    for start in range(0, len(para), step)
+                )
+
+    return chunks
+
+
+def _parse_and_chunk(
+    paper_file: Path,
+    max_chunk_size: int = 500,
+    overlap: int = 50
+) -> List[Chunk]:
+    """Parse one normalized.json and chunk it (process-pool worker)."""
+    try:
+        raw = paper_file.read_bytes()
+        paper = orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+        pmcid = paper.get('pmcid', paper_file.parent.name)
+        sections = paper.get('sections', {})
+
+        return _chunk_paper_sections(sections, pmcid, max_chunk_size, overlap)
+    except Exception as e:
+        logger.error(f"Error processing {paper_file}: {e}")
+        return []
+
+
 class RAGIndex:
     """RAG index for semantic search over paper paragraphs."""
 
@@ -77,7 +317,10 @@ class RAGIndex:
         self,
         embedding_model: str = "sentence-transformers/all-MiniLM-L6-v2",
         index_path: Optional[Path] = None,
-        dimension: int = 384
+        dimension: int = 384,
+        nprobe: Optional[int] = None,
+        backend: Optional[str] = None,
+        quantized: bool = True
     ):
         """
         Initialize RAG index.
@@ -86,19 +329,32 @@ class RAGIndex:
             embedding_model: HuggingFace model name for embeddings
             index_path: Path to save/load FAISS index
             dimension: Embedding dimension (384 for MiniLM, 768 for E5-base)
+            nprobe: Inverted lists probed per IVF search (default from
+                RAG_NPROBE env var, 16)
+            backend: sentence-transformers inference backend ("onnx",
+                "openvino" or "torch"; default onnx, or openvino when
+                ONNX_PROVIDER=openvino)
+            quantized: Use the int8 AVX-512 VNNI quantized ONNX weights
         """
         self.embedding_model_name = embedding_model
         self.dimension = dimension
+        self.nprobe = nprobe if nprobe is not None else int(os.getenv("RAG_NPROBE", "16"))
         self.index_path = index_path or Path("data/rag/index.faiss")
         self.metadata_path = self.index_path.parent / "metadata.pkl"
+        self.chunks_path = self.index_path.parent / "chunks.npz"
+        self.answer_cache_path = self.index_path.parent / "answer_cache.faiss"
 
-        # Initialize embedding model
+        # The embedding model is loaded lazily on first use (see the
+        # encoder property) so cold starts that never touch search — e.g.
+        # /health probes on serverless — skip the multi-second model load
         if SentenceTransformer is None:
             raise ImportError("sentence-transformers not installed. Install with: pip install sentence-transformers")
 
-        logger.info(f"Loading embedding model: {embedding_model}")
-        self.encoder = SentenceTransformer(embedding_model)
-        self.dimension = self.encoder.get_sentence_embedding_dimension()
+        if backend is None:
+            backend = "openvino" if os.getenv("ONNX_PROVIDER") == "openvino" else "onnx"
+        self._backend = backend
+        self._quantized = quantized
+        self._encoder = None
 
         # Initialize FAISS index
         if faiss is None:
@@ -107,23 +363,128 @@ class RAGIndex:
         self.index = None
         self.chunks: List[Chunk] = []
 
+        # Semantic answer cache: questions whose embedding is within
+        # cache_threshold cosine similarity of an earlier one reuse its
+        # answer and skip the LLM call entirely
+        self.cache_threshold = float(os.getenv("RAG_ANSWER_CACHE_THRESHOLD", "0.95"))
+        self._answer_cache = self._init_answer_cache()
+        self._cached_answers: List[Dict[str, Any]] = []
+
+        # Build-time encode cache: identical boilerplate chunks (funding
+        # statements, common methods text) across papers encode only once
+        self._emb_cache: Dict[bytes, np.ndarray] = {}
+
         # Try to load existing index
         if self.index_path.exists():
             self.load()
         else:
             self._init_new_index()
 
+    @property
+    def encoder(self) -> "SentenceTransformer":
+        """The sentence encoder, loaded on first access."""
+        if self._encoder is None:
+            logger.info(
+                f"Loading embedding model: {self.embedding_model_name} (backend={self._backend})"
+            )
+            self._encoder = self._load_encoder(
+                self.embedding_model_name, self._backend, self._quantized
+            )
+            model_dim = self._encoder.get_sentence_embedding_dimension()
+            if model_dim != self.dimension:
+                if len(self.chunks) > 0:
+                    logger.warning(
+                        f"Encoder dimension {model_dim} != index dimension {self.dimension}"
+                    )
+                else:
+                    # Nothing indexed yet: rebuild the empty indexes at
+                    # the model's true dimension
+                    self.dimension = model_dim
+                    self._init_new_index()
+                    self._answer_cache = self._init_answer_cache()
+        return self._encoder
+
+    @staticmethod
+    def _load_encoder(embedding_model: str, backend: str, quantized: bool) -> "SentenceTransformer":
+        """Load the encoder, preferring ONNX/OpenVINO for CPU inference."""
+        model_kwargs = {}
+        if backend == "onnx" and quantized:
+            # int8 weights exploit AVX-512 VNNI dot products on recent CPUs
+            model_kwargs["file_name"] = "onnx/model_qint8_avx512_vnni.onnx"
+
+        try:
+            return SentenceTransformer(
+                embedding_model, backend=backend, model_kwargs=model_kwargs or None
+            )
+        except Exception as e:
+            logger.warning(f"{backend} backend unavailable ({e}); using torch backend")
+            return SentenceTransformer(embedding_model)
+
     def _init_new_index(self):
-        """Initialize a new FAISS index."""
-        # Use IndexFlatIP for cosine similarity (after L2 normalization)
-        self.index = faiss.IndexFlatIP(self.dimension)
+        """Initialize a new FAISS index from the configured factory string."""
+        # Inner-product metric over L2-normalized vectors gives cosine
+        # similarity; the default IVF+PQ layout prunes the search to nprobe
+        # inverted lists and compresses vectors to PQ codes.
+        factory = os.getenv("RAG_INDEX_FACTORY", "IVF4096,PQ64")
+        try:
+            self.index = faiss.index_factory(
+                self.dimension, factory, faiss.METRIC_INNER_PRODUCT
+            )
+        except Exception as e:
+            logger.warning(f"index_factory('{factory}') failed ({e}); using IndexFlatIP")
+            self.index = faiss.IndexFlatIP(self.dimension)
+
+        self._apply_search_params()
         self.chunks = []
-        logger.info(f"Initialized new FAISS index with dimension {self.dimension}")
+        logger.info(f"Initialized new FAISS index ({factory}) with dimension {self.dimension}")
 
-    def _normalize_embeddings(self, embeddings: np.ndarray) -> np.ndarray:
-        """Normalize embeddings for cosine similarity."""
-        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
-        return embeddings / norms
+    def _init_answer_cache(self):
+        """
+        Build the semantic answer cache index.
+
+        PQ codes keep long-lived caches at ~50 bytes per cached query
+        instead of 1.5 KB of raw float32, so weeks of production traffic
+        stay in tens of MB. Trained once on random normalized vectors,
+        which is adequate for a similarity-threshold cache.
+        """
+        factory = os.getenv("RAG_ANSWER_CACHE_FACTORY", "IVF64,PQ48x8")
+        try:
+            cache = faiss.index_factory(
+                self.dimension, factory, faiss.METRIC_INNER_PRODUCT
+            )
+            boot = np.random.default_rng(0).standard_normal(
+                (1024, self.dimension)
+            ).astype(np.float32)
+            faiss.normalize_L2(boot)
+            cache.train(boot)
+            return cache
+        except Exception as e:
+            logger.warning(f"Answer cache factory '{factory}' failed ({e}); using IndexFlatIP")
+            return faiss.IndexFlatIP(self.dimension)
+
+    def _apply_search_params(self):
+        """Apply tunable search parameters (nprobe for IVF indexes)."""
+        try:
+            faiss.ParameterSpace().set_index_parameter(self.index, "nprobe", self.nprobe)
+        except Exception:
+            # Flat and HNSW indexes have no nprobe parameter
+            pass
+
+    @staticmethod
+    def _normalize_embeddings(embeddings: np.ndarray) -> np.ndarray:
+        """Normalize embeddings in place for cosine similarity."""
+        # faiss.normalize_L2 fuses the norm and divide into one SIMD pass
+        # over a contiguous float32 buffer, with no temporary array
+        embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+        try:
+            faiss.normalize_L2(embeddings)
+        except AttributeError:
+            # Fused in-place equivalent: one einsum pass for the squared
+            # norms, reciprocal sqrt, then an in-place scale
+            inverse = np.sqrt(np.einsum('ij,ij->i', embeddings, embeddings))
+            np.reciprocal(inverse, out=inverse)
+            embeddings *= inverse[:, None]
+        return embeddings
 
     def chunk_paper_sections(
         self,
@@ -144,69 +505,114 @@ class RAGIndex:
         Returns:
             List of Chunk objects
         """
-        chunks = []
-
-        # Prioritize Results > Discussion > Conclusion
-        section_priority = ['results', 'discussion', 'conclusion', 'abstract']
-
-        for section_name in section_priority:
-            section_text = sections.get(section_name, '')
-            if not section_text:
-                continue
-
-            # Split by paragraphs (double newline or single newline)
-            paragraphs = [p.strip() for p in section_text.split('\n\n') if p.strip()]
-
-            for para in paragraphs:
-                # Further split if paragraph is too long
-                if len(para) <= max_chunk_size:
-                    chunks.append(Chunk(
-                        text=para,
-                        pmcid=pmcid,
-                        section=section_name,
-                        offsets=None
-                    ))
-                else:
-                    # Split into overlapping chunks
-                    start = 0
-                    while start < len(para):
-                        end = min(start + max_chunk_size, len(para))
-                        chunk_text = para[start:end]
-
-                        chunks.append(Chunk(
-                            text=chunk_text,
-                            pmcid=pmcid,
-                            section=section_name,
-                            offsets=(start, end)
-                        ))
-
-                        start += max_chunk_size - overlap
-
-        return chunks
+        return _chunk_paper_sections(sections, pmcid, max_chunk_size, overlap)
 
     def add_chunks(self, chunks: List[Chunk]):
         """Add chunks to the index."""
         if not chunks:
             return
 
-        # Generate embeddings
+        # Generate embeddings, skipping texts already encoded in a previous
+        # batch (duplicate boilerplate is common across papers)
         texts = [chunk.text for chunk in chunks]
-        logger.info(f"Encoding {len(texts)} chunks...")
-        embeddings = self.encoder.encode(texts, show_progress_bar=True, convert_to_numpy=True)
+        keys = [
+            hashlib.blake2b(t.encode('utf-8'), digest_size=16).digest()
+            for t in texts
+        ]
+
+        embeddings = np.empty((len(texts), self.dimension), dtype=np.float32)
+        miss_rows: Dict[bytes, List[int]] = {}
+        for i, key in enumerate(keys):
+            cached = self._emb_cache.get(key)
+            if cached is not None:
+                embeddings[i] = cached
+            else:
+                miss_rows.setdefault(key, []).append(i)
+
+        if miss_rows:
+            miss_texts = [texts[rows[0]] for rows in miss_rows.values()]
+            logger.info(f"Encoding {len(miss_texts)} chunks ({len(texts) - len(miss_texts)} cached)...")
+
+            # Encode in length-sorted order so mini-batches pad to similar
+            # lengths instead of the longest chunk, then scatter back
+            order = np.argsort([len(t) for t in miss_texts])
+            encoded = self._encode_texts([miss_texts[i] for i in order], batch_size=64)
+            inverse = np.empty_like(order)
+            inverse[order] = np.arange(len(order))
+            encoded = encoded[inverse].astype(np.float32, copy=False)
+
+            for key, vector in zip(miss_rows, encoded):
+                self._emb_cache[key] = vector
+                for row in miss_rows[key]:
+                    embeddings[row] = vector
 
         # Normalize for cosine similarity
         embeddings = self._normalize_embeddings(embeddings)
 
+        # IVF/PQ indexes need training before the first add; corpora too
+        # small to cluster get a graph-based HNSW index instead, which
+        # needs no training and stays sub-linear
+        if not self.index.is_trained:
+            try:
+                logger.info(f"Training FAISS index on {len(embeddings)} vectors")
+                self.index.train(embeddings)
+            except Exception as e:
+                logger.warning(f"Index training failed ({e}); falling back to HNSW32,SQ8")
+                try:
+                    # int8 scalar quantization keeps the fallback at a
+                    # quarter of the float32 footprint; SQ training works
+                    # on arbitrarily small batches, unlike IVF clustering
+                    self.index = faiss.index_factory(
+                        self.dimension, "HNSW32,SQ8", faiss.METRIC_INNER_PRODUCT
+                    )
+                    self.index.hnsw.efSearch = 64
+                    self.index.train(embeddings)
+                except Exception:
+                    self.index = faiss.IndexFlatIP(self.dimension)
+
         # Add to index
         start_id = len(self.chunks)
         for i, chunk in enumerate(chunks):
             chunk.chunk_id = start_id + i
 
         self.chunks.extend(chunks)
-        self.index.add(embeddings.astype('float32'))
+        self.index.add(embeddings)
 
         logger.info(f"Added {len(chunks)} chunks to index. Total: {len(self.chunks)}")
 
+    def _encode_texts(self, texts: List[str], batch_size: int = 64) -> np.ndarray:
+        """
+        Encode texts by driving tokenize + forward directly.
+
+        Skips the per-call setup that encode() repeats for every batch;
+        the Rust fast tokenizer runs once per mini-batch and the tensors
+        feed straight into the model. Falls back to encode() when the
+        torch-level path is unavailable (e.g. non-torch backends).
+        """
+        if torch is None:
+            return self.encoder.encode(
+                texts, batch_size=batch_size, show_progress_bar=True, convert_to_numpy=True
+            )
+
+        try:
+            device = self.encoder.device
+            parts = []
+            with torch.no_grad():
+                for i in range(0, len(texts), batch_size):
+                    features = self.encoder.tokenize(texts[i:i + batch_size])
+                    features = {
+                        k: v.to(device) if hasattr(v, 'to') else v
+                        for k, v in features.items()
+                    }
+                    embedding = self.encoder.forward(features)['sentence_embedding']
+                    parts.append(embedding.cpu().numpy())
+            return np.vstack(parts)
+        except Exception as e:
+            logger.warning(f"Direct tokenize/forward path failed ({e}); using encode()")
+            return self.encoder.encode(
+                texts, batch_size=batch_size, show_progress_bar=True, convert_to_numpy=True
+            )
+
     def build_from_normalized_papers(self, normalized_dir: Path):
         """
         Build index from normalized paper files.
@@ -215,34 +621,48 @@ class RAGIndex:
             normalized_dir: Directory containing normalized.json files
         """
         all_chunks = []
-
-        paper_files = list(normalized_dir.glob("*/normalized.json"))
-        logger.info(f"Found {len(paper_files)} papers to index")
-
-        for paper_file in paper_files:
-            try:
-                with open(paper_file, 'r', encoding='utf-8') as f:
-                    paper = json.load(f)
-
-                pmcid = paper.get('pmcid', paper_file.parent.name)
-                sections = paper.get('sections', {})
-
-                chunks = self.chunk_paper_sections(sections, pmcid)
+        num_papers = 0
+
+        # Stream paths from the directory walk instead of materializing the
+        # full list, so workers start parsing as soon as discovery begins
+        paper_files = normalized_dir.rglob("normalized.json")
+        logger.info(f"Indexing papers under {normalized_dir}")
+
+        # Parse and chunk across all cores while the encoder works on
+        # already-buffered batches
+        with concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            for chunks in executor.map(_parse_and_chunk, paper_files, chunksize=32):
+                num_papers += 1
                 all_chunks.extend(chunks)
 
                 if len(all_chunks) >= 1000:  # Process in batches
                     self.add_chunks(all_chunks)
                     all_chunks = []
 
-            except Exception as e:
-                logger.error(f"Error processing {paper_file}: {e}")
-                continue
-
         # Add remaining chunks
         if all_chunks:
             self.add_chunks(all_chunks)
 
-        logger.info(f"Index built with {len(self.chunks)} total chunks")
+        logger.info(f"Indexed {num_papers} papers; {len(self.chunks)} total chunks")
+
+    def to_gpu(self) -> bool:
+        """
+        Move the FAISS index to all available GPUs.
+
+        Returns:
+            True if the index was moved, False otherwise (no GPUs or
+            faiss-cpu build).
+        """
+        try:
+            num_gpus = faiss.get_num_gpus()
+            if num_gpus > 0:
+                self.index = faiss.index_cpu_to_all_gpus(self.index)
+                logger.info(f"FAISS index moved to {num_gpus} GPU(s)")
+                return True
+        except AttributeError:
+            # faiss-cpu builds have no GPU helpers
+            pass
+        return False
 
     def search(self, query: str, top_k: int = 5) -> List[SearchResult]:
         """
@@ -255,35 +675,59 @@ class RAGIndex:
         Returns:
             List of SearchResult objects sorted by similarity
         """
+        return self.search_batch([query], top_k=top_k)[0]
+
+    def search_batch(self, queries: List[str], top_k: int = 5) -> List[List[SearchResult]]:
+        """
+        Search for similar chunks for a batch of queries in one FAISS call.
+
+        Args:
+            queries: Search queries
+            top_k: Number of results to return per query
+
+        Returns:
+            One list of SearchResult objects per query, sorted by similarity
+        """
         if not self.chunks:
             logger.warning("Index is empty")
-            return []
+            return [[] for _ in queries]
 
-        # Encode query
-        query_embedding = self.encoder.encode([query], convert_to_numpy=True)
-        query_embedding = self._normalize_embeddings(query_embedding)
+        # Encode queries as one batch
+        query_embeddings = self.encoder.encode(queries, convert_to_numpy=True)
+        query_embeddings = self._normalize_embeddings(query_embeddings)
 
-        # Search
-        scores, indices = self.index.search(query_embedding.astype('float32'), top_k)
+        # Pad small batches to 16 rows: FAISS routes nq >= ~20 scans
+        # through its BLAS/GEMM path, which beats the per-query loop path
+        num_queries = query_embeddings.shape[0]
+        if num_queries < 16:
+            padding = np.zeros((16 - num_queries, query_embeddings.shape[1]), dtype=np.float32)
+            query_embeddings = np.vstack([query_embeddings, padding])
+
+        # Search, discarding the padded rows
+        scores, indices = self.index.search(query_embeddings, top_k)
 
         # Build results
-        results = []
-        for score, idx in zip(scores[0], indices[0]):
-            if idx < len(self.chunks):
-                results.append(SearchResult(
-                    chunk=self.chunks[idx],
-                    score=score
-                ))
+        all_results = []
+        for row_scores, row_indices in zip(scores[:num_queries], indices[:num_queries]):
+            results = []
+            for score, idx in zip(row_scores, row_indices):
+                if 0 <= idx < len(self.chunks):
+                    results.append(SearchResult(
+                        chunk=self.chunks[idx],
+                        score=score
+                    ))
+            all_results.append(results)
 
-        return results
+        return all_results
 
     def answer_question(
         self,
         question: str,
         top_k: int = 5,
         llm_provider: str = "openai",
-        model: str = "gpt-4"
-    ) -> Dict[str, Any]:
+        model: str = "gpt-4",
+        stream: bool = False
+    ) -> Any:
         """
         Answer a question using RAG.
 
@@ -292,39 +736,157 @@ class RAGIndex:
             top_k: Number of chunks to retrieve
             llm_provider: LLM provider (openai, anthropic)
             model: Model name
+            stream: Yield partial dicts as the answer generates instead
+                of blocking on the full completion
 
         Returns:
-            Dict with answer, sources, and metadata
+            Dict with answer, sources, and metadata; with stream=True, an
+            iterator of {'delta': ...} dicts ending with the full dict
         """
+        # Check the semantic cache before doing any retrieval
+        query_embedding = self.encoder.encode([question], convert_to_numpy=True)
+        query_embedding = self._normalize_embeddings(query_embedding)
+
+        if self._answer_cache.ntotal > 0:
+            scores, indices = self._answer_cache.search(query_embedding, 1)
+            if scores[0][0] >= self.cache_threshold:
+                cached = dict(self._cached_answers[int(indices[0][0])])
+                cached['cache_hit'] = True
+                return iter([cached]) if stream else cached
+
         # Retrieve relevant chunks
         results = self.search(question, top_k=top_k)
+        answer = self.answer_from_results(
+            question, results, llm_provider=llm_provider, model=model, stream=stream
+        )
+
+        if not stream and self._is_cacheable_answer(answer):
+            self._answer_cache.add(query_embedding)
+            self._cached_answers.append(answer)
+
+        return answer
+
+    @staticmethod
+    def _is_cacheable_answer(answer: Dict[str, Any]) -> bool:
+        """Whether an answer is safe to put in the semantic cache.
+
+        LLM failures come back as answer text rather than raised
+        exceptions, and empty-retrieval answers carry no sources. Caching
+        either would serve the failure to every paraphrase within the
+        similarity threshold — and the cache persists across restarts.
+        """
+        if not answer.get('sources'):
+            return False
+        text = answer.get('answer') or ''
+        return not text.startswith((
+            'Error generating answer:',
+            'OpenAI client not available',
+            'Unsupported LLM provider',
+        ))
+
+    def answer_from_results(
+        self,
+        question: str,
+        results: List[SearchResult],
+        llm_provider: str = "openai",
+        model: str = "gpt-4",
+        stream: bool = False
+    ) -> Any:
+        """
+        Synthesize an answer from already-retrieved chunks.
+
+        Lets callers batch the retrieval step (e.g. across concurrent API
+        requests) and only run the per-question LLM call here.
+
+        Args:
+            question: Question to answer
+            results: Retrieved chunks with scores
+            llm_provider: LLM provider (openai, anthropic)
+            model: Model name
+            stream: Yield partial dicts as the answer generates
 
+        Returns:
+            Dict with answer, sources, and metadata; an iterator of
+            partial dicts when stream=True
+        """
         if not results:
-            return {
+            empty = {
                 'answer': 'No relevant information found.',
                 'sources': [],
                 'question': question
             }
+            return iter([empty]) if stream else empty
 
-        # Build context from chunks
-        context_parts = []
-        sources = []
+        prompt, sources = self.build_prompt(question, results)
 
-        for i, result in enumerate(results, 1):
-            chunk = result.chunk
-            context_parts.append(
-                f"[{i}] From {chunk.pmcid} ({chunk.section}):\n{chunk.text}\n"
-            )
-            sources.append({
-                'pmcid': chunk.pmcid,
-                'section': chunk.section,
-                'text': chunk.text[:200] + '...' if len(chunk.text) > 200 else chunk.text,
-                'score': float(result.score)
-            })
+        if stream:
+            return self._stream_answer(question, prompt, sources, llm_provider, model)
 
-        context = '\n'.join(context_parts)
+        answer = self._generate_llm_answer(prompt, llm_provider, model)
+
+        return {
+            'answer': answer,
+            'sources': sources,
+            'question': question,
+            'num_sources': len(sources)
+        }
+
+    def _stream_answer(
+        self,
+        question: str,
+        prompt: str,
+        sources: List[Dict[str, Any]],
+        provider: str,
+        model: str
+    ):
+        """Yield {'delta': ...} dicts as tokens arrive, then the full answer."""
+        parts = []
+        for delta in self.stream_llm_answer(prompt, provider, model):
+            parts.append(delta)
+            yield {'delta': delta}
+
+        yield {
+            'answer': ''.join(parts),
+            'sources': sources,
+            'question': question,
+            'num_sources': len(sources)
+        }
+
+    def build_prompt(
+        self,
+        question: str,
+        results: List[SearchResult]
+    ) -> Tuple[str, List[Dict[str, Any]]]:
+        """
+        Build the RAG prompt and sources list from retrieved chunks.
+
+        Args:
+            question: Question to answer
+            results: Retrieved chunks with scores
+
+        Returns:
+            Tuple of (prompt, sources)
+        """
+        # Truncate excerpts before they enter the prompt — context tokens
+        # dominate LLM cost and latency — and build the context in one join
+        excerpts = [
+            r.chunk.text[:200] + '...' if len(r.chunk.text) > 200 else r.chunk.text
+            for r in results
+        ]
+        context = ''.join(
+            f"[{i}] From {r.chunk.pmcid} ({r.chunk.section}):\n{text}\n\n"
+            for i, (r, text) in enumerate(zip(results, excerpts), 1)
+        )
+        sources = [
+            {
+                'pmcid': r.chunk.pmcid,
+                'section': r.chunk.section,
+                'text': text,
+                'score': float(r.score)
+            }
+            for r, text in zip(results, excerpts)
+        ]
 
-        # Generate answer with LLM
         prompt = f"""Based on the following excerpts from space biology research papers, please answer the question.
 Cite sources using [number] notation.
 
@@ -335,38 +897,51 @@ Question: {question}
 
 Answer (cite sources):"""
 
-        answer = self._generate_llm_answer(prompt, llm_provider, model)
-
-        return {
-            'answer': answer,
-            'sources': sources,
-            'question': question,
-            'num_sources': len(sources)
-        }
+        return prompt, sources
 
     def _generate_llm_answer(self, prompt: str, provider: str, model: str) -> str:
-        """Generate answer using LLM."""
-        if provider == "openai":
-            if OpenAI is None:
-                return "OpenAI client not available. Install with: pip install openai"
+        """Generate answer using LLM (drains the streaming call)."""
+        return ''.join(self.stream_llm_answer(prompt, provider, model))
 
-            try:
-                client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-                response = client.chat.completions.create(
-                    model=model,
-                    messages=[
-                        {"role": "system", "content": "You are a helpful assistant that answers questions about space biology research. Always cite sources using [number] notation."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    temperature=0.3,
-                    max_tokens=500
-                )
-                return response.choices[0].message.content
-            except Exception as e:
-                logger.error(f"OpenAI API error: {e}")
-                return f"Error generating answer: {e}"
+    def stream_llm_answer(self, prompt: str, provider: str = "openai", model: str = "gpt-4"):
+        """
+        Generate an answer using the LLM, yielding text deltas as they arrive.
+
+        Args:
+            prompt: Full RAG prompt
+            provider: LLM provider (openai)
+            model: Model name
+
+        Yields:
+            Answer text fragments
+        """
+        if provider != "openai":
+            yield "Unsupported LLM provider"
+            return
+
+        if OpenAI is None:
+            yield "OpenAI client not available. Install with: pip install openai"
+            return
 
-        return "Unsupported LLM provider"
+        try:
+            client = _get_openai_client()
+            stream = client.chat.completions.create(
+                model=model,
+                messages=[
+                    {"role": "system", "content": "You are a helpful assistant that answers questions about space biology research. Always cite sources using [number] notation."},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.3,
+                max_tokens=500,
+                stream=True
+            )
+            for chunk in stream:
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    yield delta
+        except Exception as e:
+            logger.error(f"OpenAI API error: {e}")
+            yield f"Error generating answer: {e}"
 
     def save(self):
         """Save index and metadata to disk."""
@@ -375,12 +950,20 @@ Answer (cite sources):"""
         # Save FAISS index
         faiss.write_index(self.index, str(self.index_path))
 
-        # Save metadata
+        # Save the answer cache alongside the main index
+        if self._answer_cache.ntotal > 0:
+            faiss.write_index(self._answer_cache, str(self.answer_cache_path))
+
+        # Save chunk metadata as Struct-of-Arrays: one compressed array per
+        # field instead of a pickle with one Python object per chunk
+        np.savez_compressed(self.chunks_path, **_chunks_to_arrays(self.chunks))
+
+        # Save the small remaining metadata
         with open(self.metadata_path, 'wb') as f:
             pickle.dump({
-                'chunks': self.chunks,
                 'embedding_model': self.embedding_model_name,
-                'dimension': self.dimension
+                'dimension': self.dimension,
+                'cached_answers': self._cached_answers
             }, f)
 
         logger.info(f"Index saved to {self.index_path}")
@@ -392,12 +975,27 @@ Answer (cite sources):"""
 
         # Load FAISS index
         self.index = faiss.read_index(str(self.index_path))
+        self._apply_search_params()
 
         # Load metadata
         with open(self.metadata_path, 'rb') as f:
             metadata = pickle.load(f)
-            self.chunks = metadata['chunks']
             self.dimension = metadata['dimension']
+            self._cached_answers = metadata.get('cached_answers', [])
+
+        # Chunk metadata lives in a SoA .npz; chunks are materialized lazily
+        # on retrieval. Older indexes still carry the chunk list in the pickle.
+        if self.chunks_path.exists():
+            self.chunks = _ChunkStore(np.load(self.chunks_path))
+        else:
+            self.chunks = metadata['chunks']
+
+        # Restore the answer cache when it was persisted
+        if self._cached_answers and self.answer_cache_path.exists():
+            self._answer_cache = faiss.read_index(str(self.answer_cache_path))
+        else:
+            self._cached_answers = []
+            self._answer_cache = self._init_answer_cache()
 
         logger.info(f"Index loaded with {len(self.chunks)} chunks")
 
@@ -1,611 +1,1081 @@
-"""
-Production-ready Neo4j loader for Space Biology Knowledge Graph.
-
-This module loads findings from findings.jsonl into Neo4j, creating:
-- Nodes: Paper, Experiment, Finding, Organism, Tissue, CellType, Phenotype, Exposure, Platform, Assay, Duration
-- Relationships: DESCRIBES, REPORTS, INVOLVES, APPLIES, MEASURES, AFFECTS, OBSERVED_IN, TIMED_AT, EVIDENCE
-
-Features:
-- Batch processing with configurable batch size
-- Strict deduplication on ontology identifiers
-- Automatic timestamp management (first_seen, last_seen)
-- Synonym and label management
-- Dry-run mode for testing
-- Comprehensive metrics logging
-"""
-
-import os
-import json
-import logging
-import argparse
-import uuid
-from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Any, Optional, Tuple
-from collections import defaultdict
-import sys
-
-try:
-    from neo4j import GraphDatabase, Transaction
-    from neo4j.exceptions import ServiceUnavailable, AuthError
-except ImportError:
-    print("neo4j package not installed. Install with: pip install neo4j")
-    sys.exit(1)
-
-logger = logging.getLogger(__name__)
-
-
-class Neo4jLoader:
-    """Load findings into Neo4j knowledge graph."""
-
-    def __init__(
-        self,
-        uri: str,
-        user: str,
-        password: str,
-        database: str = "neo4j",
-        batch_size: int = 100,
-        dry_run: bool = False
-    ):
-        """
-        Initialize Neo4j loader.
-
-        Args:
-            uri: Neo4j connection URI (e.g., bolt://localhost:7687)
-            user: Neo4j username
-            password: Neo4j password
-            database: Database name (default: neo4j)
-            batch_size: Batch size for bulk operations
-            dry_run: If True, don't actually write to database
-        """
-        self.uri = uri
-        self.user = user
-        self.database = database
-        self.batch_size = batch_size
-        self.dry_run = dry_run
-
-        # Initialize driver
-        if not dry_run:
-            try:
-                self.driver = GraphDatabase.driver(uri, auth=(user, password))
-                # Test connection
-                with self.driver.session(database=database) as session:
-                    result = session.run("RETURN 1")
-                    result.single()
-                logger.info(f"Connected to Neo4j at {uri}")
-            except (ServiceUnavailable, AuthError) as e:
-                logger.error(f"Failed to connect to Neo4j: {e}")
-                raise
-        else:
-            self.driver = None
-            logger.info("Dry-run mode: no database connection")
-
-        # Metrics
-        self.metrics = defaultdict(int)
-
-    def close(self):
-        """Close Neo4j connection."""
-        if self.driver:
-            self.driver.close()
-
-    def initialize_schema(self):
-        """Initialize Neo4j schema (constraints and indexes)."""
-        if self.dry_run:
-            logger.info("Dry-run: would initialize schema")
-            return
-
-        schema_file = Path(__file__).parent / "neo4j_schema.cypher"
-
-        if not schema_file.exists():
-            logger.warning(f"Schema file not found: {schema_file}")
-            return
-
-        with open(schema_file, 'r') as f:
-            schema_statements = f.read()
-
-        # Split by semicolon and filter comments
-        statements = [
-            stmt.strip()
-            for stmt in schema_statements.split(';')
-            if stmt.strip() and not stmt.strip().startswith('//')
-        ]
-
-        with self.driver.session(database=self.database) as session:
-            for stmt in statements:
-                try:
-                    session.run(stmt)
-                    logger.debug(f"Executed: {stmt[:50]}...")
-                except Exception as e:
-                    # Some constraints may already exist
-                    if "already exists" in str(e).lower():
-                        logger.debug(f"Constraint already exists, skipping")
-                    else:
-                        logger.warning(f"Error executing statement: {e}")
-
-        logger.info("Schema initialized")
-
-    def _get_current_timestamp(self) -> str:
-        """Get current ISO timestamp."""
-        return datetime.utcnow().isoformat()
-
-    def _ensure_ontology_node(
-        self,
-        tx: Transaction,
-        label: str,
-        ontology_data: Dict[str, Any],
-        extra_props: Dict[str, Any] = None
-    ) -> str:
-        """
-        Ensure an ontology-based node exists (MERGE with deduplication).
-
-        Args:
-            tx: Neo4j transaction
-            label: Node label (Organism, Tissue, CellType, Phenotype)
-            ontology_data: Dict with {id, label, source_obo, synonyms, confidence}
-            extra_props: Additional properties to set
-
-        Returns:
-            The obo_id of the node
-        """
-        obo_id = ontology_data.get('id')
-        node_label = ontology_data.get('label')
-        source_obo = ontology_data.get('source_obo')
-        synonyms = ontology_data.get('synonyms', [])
-
-        props = {
-            'obo_id': obo_id,
-            'label': node_label,
-            'source_obo': source_obo,
-            'synonyms': synonyms,
-            'last_seen': self._get_current_timestamp()
-        }
-
-        if extra_props:
-            props.update(extra_props)
-
-        # MERGE node (deduplicate by obo_id)
-        query = f"""
-        MERGE (n:{label} {{obo_id: $obo_id}})
-        ON CREATE SET
-            n.label = $node_label,
-            n.source_obo = $source_obo,
-            n.synonyms = $synonyms,
-            n.first_seen = $timestamp,
-            n.last_seen = $timestamp,
-            n.source_count = 1
-        ON MATCH SET
-            n.last_seen = $timestamp,
-            n.source_count = COALESCE(n.source_count, 0) + 1
-        RETURN n.obo_id as id
-        """
-
-        params = {
-            'obo_id': obo_id,
-            'node_label': node_label,
-            'source_obo': source_obo,
-            'synonyms': synonyms,
-            'timestamp': self._get_current_timestamp()
-        }
-
-        # Add extra props if provided
-        if extra_props:
-            for key, value in extra_props.items():
-                if key not in params:
-                    params[key] = value
-
-        result = tx.run(query, **params)
-        record = result.single()
-        self.metrics[f'node_{label}'] += 1
-        return record['id'] if record else obo_id
-
-    def _ensure_paper_node(self, tx: Transaction, pmcid: str, paper_data: Dict = None) -> str:
-        """Ensure Paper node exists."""
-        props = {
-            'pmcid': pmcid,
-            'title': None,
-            'doi': None,
-            'year': None,
-            'journal': None,
-            'authors': [],
-            'last_seen': self._get_current_timestamp()
-        }
-
-        if paper_data:
-            props.update({
-                'title': paper_data.get('title'),
-                'doi': paper_data.get('doi'),
-                'year': paper_data.get('year'),
-                'journal': paper_data.get('journal'),
-                'authors': paper_data.get('authors', [])
-            })
-
-        query = """
-        MERGE (p:Paper {pmcid: $pmcid})
-        ON CREATE SET
-            p.title = $title,
-            p.doi = $doi,
-            p.year = $year,
-            p.journal = $journal,
-            p.authors = $authors,
-            p.first_seen = $timestamp,
-            p.last_seen = $timestamp
-        ON MATCH SET
-            p.last_seen = $timestamp
-        RETURN p.pmcid as id
-        """
-
-        result = tx.run(query, **props, timestamp=self._get_current_timestamp())
-        record = result.single()
-        self.metrics['node_Paper'] += 1
-        return record['id'] if record else pmcid
-
-    def _ensure_finding_node(self, tx: Transaction, finding: Dict) -> str:
-        """Ensure Finding node exists."""
-        finding_uuid = finding.get('uuid', str(uuid.uuid4()))
-        pmcid = finding.get('pmcid')
-        direction = finding.get('direction')
-        p_value = finding.get('p_value')
-        evidence_strength = finding.get('evidence_strength', {}).get('score', 0.0)
-
-        props = {
-            'uuid': finding_uuid,
-            'pmcid': pmcid,
-            'direction': direction,
-            'p_value': p_value,
-            'evidence_strength': evidence_strength,
-            'sample_size': finding.get('sample_size'),
-            'timepoint': finding.get('timepoint'),
-            'qualifiers': finding.get('qualifiers', []),
-            'quotes': finding.get('quotes', []),
-            'magnitude_value': None,
-            'magnitude_unit': None,
-            'magnitude_method': None,
-            'provenance_section': None,
-            'provenance_source_type': None,
-            'last_seen': self._get_current_timestamp()
-        }
-
-        # Add magnitude if present
-        if finding.get('magnitude'):
-            mag = finding['magnitude']
-            props.update({
-                'magnitude_value': mag.get('value'),
-                'magnitude_unit': mag.get('unit'),
-                'magnitude_method': mag.get('method')
-            })
-
-        # Add provenance
-        if finding.get('provenance'):
-            prov = finding['provenance']
-            props.update({
-                'provenance_section': prov.get('section'),
-                'provenance_source_type': prov.get('source_type')
-            })
-
-        query = """
-        MERGE (f:Finding {uuid: $uuid})
-        ON CREATE SET
-            f.pmcid = $pmcid,
-            f.direction = $direction,
-            f.p_value = $p_value,
-            f.evidence_strength = $evidence_strength,
-            f.sample_size = $sample_size,
-            f.timepoint = $timepoint,
-            f.qualifiers = $qualifiers,
-            f.quotes = $quotes,
-            f.magnitude_value = $magnitude_value,
-            f.magnitude_unit = $magnitude_unit,
-            f.magnitude_method = $magnitude_method,
-            f.provenance_section = $provenance_section,
-            f.provenance_source_type = $provenance_source_type,
-            f.first_seen = $timestamp,
-            f.last_seen = $timestamp
-        ON MATCH SET
-            f.last_seen = $timestamp
-        RETURN f.uuid as id
-        """
-
-        result = tx.run(query, **props, timestamp=self._get_current_timestamp())
-        record = result.single()
-        self.metrics['node_Finding'] += 1
-        return record['id'] if record else finding_uuid
-
-    def _create_relationship(
-        self,
-        tx: Transaction,
-        from_label: str,
-        from_id_prop: str,
-        from_id: str,
-        rel_type: str,
-        to_label: str,
-        to_id_prop: str,
-        to_id: str,
-        props: Dict = None
-    ):
-        """Create a relationship between two nodes."""
-        rel_props = props or {}
-        rel_props['created_at'] = self._get_current_timestamp()
-
-        # Build SET clause for properties
-        set_clauses = [f'r.{k} = ${k}' for k in rel_props.keys()]
-        set_clause = ', '.join(set_clauses) if set_clauses else 'r.created_at = $created_at'
-
-        query = f"""
-        MATCH (a:{from_label} {{{from_id_prop}: $from_id}})
-        MATCH (b:{to_label} {{{to_id_prop}: $to_id}})
-        MERGE (a)-[r:{rel_type}]->(b)
-        ON CREATE SET {set_clause}
-        RETURN count(r) as created
-        """
-
-        params = {
-            'from_id': from_id,
-            'to_id': to_id
-        }
-        params.update(rel_props)
-
-        tx.run(query, **params)
-        self.metrics[f'rel_{rel_type}'] += 1
-
-    def load_finding(self, tx: Transaction, finding: Dict):
-        """
-        Load a single finding into Neo4j with all relationships.
-
-        Creates nodes and relationships:
-        - Paper -[:REPORTS]-> Finding
-        - Finding -[:AFFECTS]-> Phenotype
-        - Finding -[:OBSERVED_IN]-> Tissue (if present)
-        - Finding -[:OBSERVED_IN]-> CellType (if present)
-        - Finding -[:IN_ORGANISM]-> Organism (if present)
-        """
-        pmcid = finding.get('pmcid')
-
-        # Ensure Paper node
-        self._ensure_paper_node(tx, pmcid)
-
-        # Ensure Finding node
-        finding_uuid = self._ensure_finding_node(tx, finding)
-
-        # Paper -[:REPORTS]-> Finding
-        prov = finding.get('provenance') or {}
-        evidence = finding.get('evidence_strength') or {}
-
-        self._create_relationship(
-            tx,
-            'Paper', 'pmcid', pmcid,
-            'REPORTS',
-            'Finding', 'uuid', finding_uuid,
-            {
-                'provenance': prov.get('section', '') if prov else '',
-                'extraction_confidence': evidence.get('score', 0.0) if evidence else 0.0
-            }
-        )
-
-        # Phenotype
-        if finding.get('phenotype'):
-            pheno = finding['phenotype'].get('ontology_term')
-            if pheno:
-                pheno_id = self._ensure_ontology_node(tx, 'Phenotype', pheno)
-
-                mag = finding.get('magnitude') or {}
-                self._create_relationship(
-                    tx,
-                    'Finding', 'uuid', finding_uuid,
-                    'AFFECTS',
-                    'Phenotype', 'obo_id', pheno_id,
-                    {
-                        'direction': finding.get('direction'),
-                        'magnitude': mag.get('value') if mag else None,
-                        'p_value': finding.get('p_value')
-                    }
-                )
-
-        # Tissue
-        if finding.get('tissue'):
-            tissue = finding['tissue'].get('ontology_term')
-            if tissue:
-                tissue_id = self._ensure_ontology_node(tx, 'Tissue', tissue)
-
-                self._create_relationship(
-                    tx,
-                    'Finding', 'uuid', finding_uuid,
-                    'OBSERVED_IN',
-                    'Tissue', 'obo_id', tissue_id
-                )
-
-        # CellType
-        if finding.get('cell_type'):
-            cell = finding['cell_type'].get('ontology_term')
-            if cell:
-                cell_id = self._ensure_ontology_node(tx, 'CellType', cell)
-
-                self._create_relationship(
-                    tx,
-                    'Finding', 'uuid', finding_uuid,
-                    'OBSERVED_IN',
-                    'CellType', 'obo_id', cell_id
-                )
-
-        # Organism
-        if finding.get('organism'):
-            org = finding['organism'].get('ontology_term')
-            if org:
-                org_id = self._ensure_ontology_node(tx, 'Organism', org, {
-                    'strain': finding['organism'].get('strain'),
-                    'sex': finding['organism'].get('sex')
-                })
-
-                self._create_relationship(
-                    tx,
-                    'Finding', 'uuid', finding_uuid,
-                    'IN_ORGANISM',
-                    'Organism', 'obo_id', org_id
-                )
-
-    def load_findings_batch(self, findings: List[Dict]):
-        """Load a batch of findings."""
-        if self.dry_run:
-            logger.info(f"Dry-run: would load batch of {len(findings)} findings")
-            return
-
-        with self.driver.session(database=self.database) as session:
-            for finding in findings:
-                try:
-                    session.execute_write(self.load_finding, finding)
-                except Exception as e:
-                    logger.error(f"Error loading finding {finding.get('uuid')}: {e}")
-                    self.metrics['errors'] += 1
-
-    def load_from_jsonl(self, input_path: Path) -> Dict[str, int]:
-        """
-        Load findings from JSONL file.
-
-        Args:
-            input_path: Path to findings.jsonl
-
-        Returns:
-            Metrics dictionary
-        """
-        if not input_path.exists():
-            raise FileNotFoundError(f"Input file not found: {input_path}")
-
-        findings = []
-        total_loaded = 0
-
-        logger.info(f"Loading findings from {input_path}")
-
-        with open(input_path, 'r', encoding='utf-8') as f:
-            for line_num, line in enumerate(f, 1):
-                if not line.strip():
-                    continue
-
-                try:
-                    finding = json.loads(line)
-                    findings.append(finding)
-
-                    # Load in batches
-                    if len(findings) >= self.batch_size:
-                        self.load_findings_batch(findings)
-                        total_loaded += len(findings)
-                        logger.info(f"Loaded {total_loaded} findings...")
-                        findings = []
-
-                except json.JSONDecodeError as e:
-                    logger.error(f"JSON decode error at line {line_num}: {e}")
-                    self.metrics['parse_errors'] += 1
-
-        # Load remaining findings
-        if findings:
-            self.load_findings_batch(findings)
-            total_loaded += len(findings)
-
-        self.metrics['total_loaded'] = total_loaded
-        logger.info(f"Completed loading {total_loaded} findings")
-
-        return dict(self.metrics)
-
-    def get_graph_metrics(self) -> Dict[str, Any]:
-        """Get graph statistics."""
-        if self.dry_run:
-            return {'dry_run': True}
-
-        metrics = {}
-
-        with self.driver.session(database=self.database) as session:
-            # Node counts by label
-            result = session.run("""
-                CALL db.labels() YIELD label
-                CALL apoc.cypher.run('MATCH (n:' + label + ') RETURN count(n) as count', {})
-                YIELD value
-                RETURN label, value.count as count
-            """)
-
-            for record in result:
-                metrics[f"node_count_{record['label']}"] = record['count']
-
-            # Relationship counts by type
-            result = session.run("""
-                CALL db.relationshipTypes() YIELD relationshipType
-                CALL apoc.cypher.run('MATCH ()-[r:' + relationshipType + ']->() RETURN count(r) as count', {})
-                YIELD value
-                RETURN relationshipType, value.count as count
-            """)
-
-            for record in result:
-                metrics[f"rel_count_{record['relationshipType']}"] = record['count']
-
-        return metrics
-
-
-def main():
-    """CLI entrypoint: python -m kg.load_to_neo4j --uri bolt://neo4j:7687 --user neo4j --password pass --input /data/jsonl/findings.jsonl"""
-    parser = argparse.ArgumentParser(
-        description="Load findings into Neo4j knowledge graph"
-    )
-    parser.add_argument('--uri', type=str, default='bolt://localhost:7687', help='Neo4j URI')
-    parser.add_argument('--user', type=str, default='neo4j', help='Neo4j username')
-    parser.add_argument('--password', type=str, required=True, help='Neo4j password')
-    parser.add_argument('--database', type=str, default='neo4j', help='Neo4j database name')
-    parser.add_argument('--input', type=str, required=True, help='Input findings.jsonl path')
-    parser.add_argument('--batch-size', type=int, default=100, help='Batch size for loading')
-    parser.add_argument('--dry-run', action='store_true', help='Dry run (no database writes)')
-    parser.add_argument('--init-schema', action='store_true', help='Initialize schema first')
-    parser.add_argument('--metrics-output', type=str, help='Output metrics to NDJSON file')
-    parser.add_argument('--log-level', type=str, default='INFO', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'])
-
-    args = parser.parse_args()
-
-    # Setup logging
-    logging.basicConfig(
-        level=getattr(logging, args.log_level),
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
-
-    # Initialize loader
-    loader = Neo4jLoader(
-        uri=args.uri,
-        user=args.user,
-        password=args.password,
-        database=args.database,
-        batch_size=args.batch_size,
-        dry_run=args.dry_run
-    )
-
-    try:
-        # Initialize schema if requested
-        if args.init_schema:
-            logger.info("Initializing Neo4j schema...")
-            loader.initialize_schema()
-
-        # Load findings
-        input_path = Path(args.input)
-        metrics = loader.load_from_jsonl(input_path)
-
-        # Get graph metrics
-        if not args.dry_run:
-            graph_metrics = loader.get_graph_metrics()
-            metrics.update(graph_metrics)
-
-        # Print metrics
-        logger.info("=== Load Metrics ===")
-        for key, value in sorted(metrics.items()):
-            logger.info(f"{key}: {value}")
-
-        # Save metrics to file if requested
-        if args.metrics_output:
-            metrics_path = Path(args.metrics_output)
-            metrics_path.parent.mkdir(parents=True, exist_ok=True)
-
-            with open(metrics_path, 'a', encoding='utf-8') as f:
-                metrics['timestamp'] = datetime.utcnow().isoformat()
-                metrics['input_file'] = str(input_path)
-                f.write(json.dumps(metrics, ensure_ascii=False) + '\n')
-
-            logger.info(f"Metrics saved to {metrics_path}")
-
-    finally:
-        loader.close()
-
-
-if __name__ == "__main__":
-    main()
+"""
+Production-ready Neo4j loader for Space Biology Knowledge Graph.
+
+This module loads findings from findings.jsonl into Neo4j, creating:
+- Nodes: Paper, Experiment, Finding, Organism, Tissue, CellType, Phenotype, Exposure, Platform, Assay, Duration
+- Relationships: DESCRIBES, REPORTS, INVOLVES, APPLIES, MEASURES, AFFECTS, OBSERVED_IN, TIMED_AT, EVIDENCE
+
+Features:
+- Batch processing with configurable batch size
+- Strict deduplication on ontology identifiers
+- Automatic timestamp management (first_seen, last_seen)
+- Synonym and label management
+- Dry-run mode for testing
+- Comprehensive metrics logging
+"""
+
+import os
+import json
+import hashlib
+import logging
+import argparse
+import mmap
+import queue
+import threading
+import time
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Tuple
+from collections import Counter, defaultdict
+import sys
+
+try:
+    from neo4j import GraphDatabase, Transaction
+    from neo4j.exceptions import ServiceUnavailable, AuthError, TransientError
+except ImportError:
+    print("neo4j package not installed. Install with: pip install neo4j")
+    sys.exit(1)
+
+# orjson parses JSONL lines several times faster than the stdlib decoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Shared read-only empty dict for absent optional sub-objects; saves one
+# allocation per missing field on the row-assembly hot path
+_EMPTY: Dict[str, Any] = {}
+
+
+class Neo4jLoader:
+    """Load findings into Neo4j knowledge graph."""
+
+    # Bounded retries on transient/deadlock errors per batch transaction
+    _MAX_TX_RETRIES = 3
+
+    def __init__(
+        self,
+        uri: str,
+        user: str,
+        password: str,
+        database: str = "neo4j",
+        batch_size: int = 100,
+        dry_run: bool = False,
+        concurrent_tx: bool = False
+    ):
+        """
+        Initialize Neo4j loader.
+
+        Args:
+            uri: Neo4j connection URI (e.g., bolt://localhost:7687)
+            user: Neo4j username
+            password: Neo4j password
+            database: Database name (default: neo4j)
+            batch_size: Batch size for bulk operations
+            dry_run: If True, don't actually write to database
+            concurrent_tx: Spread relationship writes across server threads
+                with CALL { ... } IN CONCURRENT TRANSACTIONS (Neo4j 5.21+)
+        """
+        self.uri = uri
+        self.user = user
+        self.database = database
+        self.batch_size = batch_size
+        self.dry_run = dry_run
+
+        # Initialize driver
+        if not dry_run:
+            try:
+                # Writes flow through one session, so a small pool suffices;
+                # the explicit acquisition timeout keeps a saturated pool
+                # from hanging the loader indefinitely
+                self.driver = GraphDatabase.driver(
+                    uri,
+                    auth=(user, password),
+                    max_connection_pool_size=16,
+                    connection_acquisition_timeout=60
+                )
+                # Test connection
+                with self.driver.session(database=database) as session:
+                    result = session.run("RETURN 1")
+                    result.single()
+                logger.info(f"Connected to Neo4j at {uri}")
+            except (ServiceUnavailable, AuthError) as e:
+                logger.error(f"Failed to connect to Neo4j: {e}")
+                raise
+        else:
+            self.driver = None
+            logger.info("Dry-run mode: no database connection")
+
+        # One long-lived session reused across batches instead of a pool
+        # checkout and RUN/PULL handshake per batch
+        self._session = None
+
+        # Metrics; Counter so per-batch tallies merge with one update()
+        self.metrics = Counter()
+
+        # Labels are interpolated into Cypher, so each label is a distinct
+        # statement; building every string once keeps the driver sending
+        # byte-identical query text that hits the server's plan cache
+        self._onto_queries = {
+            label: self._build_ontology_query(label)
+            for label in ('Organism', 'Tissue', 'CellType', 'Phenotype')
+        }
+        self._rel_queries: Dict[tuple, str] = {}
+
+        # MERGE keys must be constrained or every MERGE is a label scan;
+        # don't rely on the user remembering --init-schema
+        if not dry_run:
+            self.ensure_constraints()
+
+        # Concurrent sub-transactions need server support; fall back to
+        # sequential writes on older servers rather than failing batches
+        self.concurrent_tx = (
+            concurrent_tx and not dry_run and self._server_supports_concurrent_tx()
+        )
+        if concurrent_tx and not self.concurrent_tx and not dry_run:
+            logger.warning(
+                "Server does not support CALL ... IN CONCURRENT TRANSACTIONS; "
+                "falling back to sequential relationship writes"
+            )
+
+    def _server_supports_concurrent_tx(self) -> bool:
+        """Check for Neo4j 5.21+, which added IN CONCURRENT TRANSACTIONS."""
+        try:
+            with self.driver.session(database=self.database) as session:
+                record = session.run(
+                    "CALL dbms.components() YIELD versions RETURN versions[0] AS version"
+                ).single()
+            parts = record['version'].split('.')
+            return (int(parts[0]), int(parts[1])) >= (5, 21)
+        except Exception as e:
+            logger.warning(f"Could not detect server version: {e}")
+            return False
+
+    def ensure_constraints(self):
+        """
+        Idempotently create uniqueness constraints on every MERGE key.
+
+        Only the properties the loader actually merges on are constrained;
+        indexes on rarely-queried properties would just slow writes down.
+        """
+        statements = [
+            "CREATE CONSTRAINT IF NOT EXISTS FOR (p:Paper) REQUIRE p.pmcid IS UNIQUE",
+            "CREATE CONSTRAINT IF NOT EXISTS FOR (f:Finding) REQUIRE f.uuid IS UNIQUE"
+        ]
+        for label in ('Organism', 'Tissue', 'CellType', 'Phenotype'):
+            statements.append(
+                f"CREATE CONSTRAINT IF NOT EXISTS FOR (n:{label}) REQUIRE n.obo_id IS UNIQUE"
+            )
+
+        with self.driver.session(database=self.database) as session:
+            for statement in statements:
+                try:
+                    session.run(statement).consume()
+                except Exception as e:
+                    logger.warning(f"Could not create constraint ({statement}): {e}")
+        logger.info(f"Ensured {len(statements)} uniqueness constraints on MERGE keys")
+
+    def _get_session(self):
+        """Return the long-lived session, opening it on first use."""
+        if self._session is None:
+            self._session = self.driver.session(database=self.database)
+        return self._session
+
+    def close(self):
+        """Close Neo4j connection."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+        if self.driver:
+            self.driver.close()
+
+    def initialize_schema(self):
+        """Initialize Neo4j schema (constraints and indexes)."""
+        if self.dry_run:
+            logger.info("Dry-run: would initialize schema")
+            return
+
+        schema_file = Path(__file__).parent / "neo4j_schema.cypher"
+
+        if not schema_file.exists():
+            logger.warning(f"Schema file not found: {schema_file}")
+            return
+
+        with open(schema_file, 'r') as f:
+            schema_statements = f.read()
+
+        # Split by semicolon and filter comments
+        statements = [
+            stmt.strip()
+            for stmt in schema_statements.split(';')
+            if stmt.strip() and not stmt.strip().startswith('//')
+        ]
+
+        with self.driver.session(database=self.database) as session:
+            # Submit the whole script in one round trip when APOC is
+            # available instead of one network hop per statement
+            try:
+                session.run(
+                    "CALL apoc.cypher.runMany($script, {}, {statistics: false})",
+                    script=schema_statements
+                ).consume()
+                logger.info("Schema initialized")
+                return
+            except Exception as e:
+                logger.warning(f"apoc.cypher.runMany unavailable, running statements one by one: {e}")
+
+            for stmt in statements:
+                try:
+                    session.run(stmt)
+                    logger.debug(f"Executed: {stmt[:50]}...")
+                except Exception as e:
+                    # Some constraints may already exist
+                    if "already exists" in str(e).lower():
+                        logger.debug(f"Constraint already exists, skipping")
+                    else:
+                        logger.warning(f"Error executing statement: {e}")
+
+        logger.info("Schema initialized")
+
+    def _get_current_timestamp(self) -> str:
+        """Get current ISO timestamp."""
+        return datetime.utcnow().isoformat()
+
+    @staticmethod
+    def _finding_uuid(finding: Dict) -> str:
+        """
+        Stable identifier for a finding.
+
+        Falls back to a content hash when the JSONL row carries no uuid, so
+        re-ingesting the same file merges onto the same Finding node instead
+        of minting a fresh random id per run.
+        """
+        existing = finding.get('uuid')
+        if existing:
+            return existing
+        if orjson is not None:
+            payload = orjson.dumps(finding, option=orjson.OPT_SORT_KEYS)
+        else:
+            payload = json.dumps(finding, sort_keys=True, ensure_ascii=False).encode('utf-8')
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    @staticmethod
+    def _build_ontology_query(label: str) -> str:
+        """Build the MERGE statement for one ontology label."""
+        return f"""
+        MERGE (n:{label} {{obo_id: $obo_id}})
+        ON CREATE SET
+            n.label = $node_label,
+            n.source_obo = $source_obo,
+            n.synonyms = $synonyms,
+            n.first_seen = $timestamp,
+            n.last_seen = $timestamp,
+            n.source_count = 1
+        ON MATCH SET
+            n.last_seen = $timestamp,
+            n.source_count = COALESCE(n.source_count, 0) + 1
+        """
+
+    def _ensure_ontology_node(
+        self,
+        tx: Transaction,
+        label: str,
+        ontology_data: Dict[str, Any],
+        timestamp: str,
+        extra_props: Dict[str, Any] = None
+    ) -> str:
+        """
+        Ensure an ontology-based node exists (MERGE with deduplication).
+
+        Args:
+            tx: Neo4j transaction
+            label: Node label (Organism, Tissue, CellType, Phenotype)
+            ontology_data: Dict with {id, label, source_obo, synonyms, confidence}
+            timestamp: ISO timestamp shared by the whole finding
+            extra_props: Additional properties to set
+
+        Returns:
+            The obo_id of the node
+        """
+        obo_id = ontology_data.get('id')
+        node_label = ontology_data.get('label')
+        source_obo = ontology_data.get('source_obo')
+        synonyms = ontology_data.get('synonyms', [])
+
+        # MERGE node (deduplicate by obo_id); prebuilt per label
+        query = self._onto_queries.get(label)
+        if query is None:
+            query = self._onto_queries[label] = self._build_ontology_query(label)
+
+        params = {
+            'obo_id': obo_id,
+            'node_label': node_label,
+            'source_obo': source_obo,
+            'synonyms': synonyms,
+            'timestamp': timestamp
+        }
+
+        # Add extra props if provided
+        if extra_props:
+            for key, value in extra_props.items():
+                if key not in params:
+                    params[key] = value
+
+        # The MERGE key is already known; no need to round-trip it back
+        tx.run(query, **params)
+        self.metrics[f'node_{label}'] += 1
+        return obo_id
+
+    def _ensure_paper_node(
+        self,
+        tx: Transaction,
+        pmcid: str,
+        timestamp: str,
+        paper_data: Dict = None
+    ) -> str:
+        """Ensure Paper node exists."""
+        props = {}
+        if paper_data:
+            props = {
+                k: v for k, v in {
+                    'title': paper_data.get('title'),
+                    'doi': paper_data.get('doi'),
+                    'year': paper_data.get('year'),
+                    'journal': paper_data.get('journal'),
+                    'authors': paper_data.get('authors', [])
+                }.items() if v is not None
+            }
+
+        query = """
+        MERGE (p:Paper {pmcid: $pmcid})
+        ON CREATE SET
+            p += $props,
+            p.first_seen = $timestamp,
+            p.last_seen = $timestamp
+        ON MATCH SET
+            p.last_seen = $timestamp
+        """
+
+        tx.run(query, pmcid=pmcid, props=props, timestamp=timestamp)
+        self.metrics['node_Paper'] += 1
+        return pmcid
+
+    def _ensure_finding_node(self, tx: Transaction, finding: Dict, timestamp: str) -> str:
+        """Ensure Finding node exists."""
+        finding_uuid = self._finding_uuid(finding)
+
+        query = """
+        MERGE (f:Finding {uuid: $uuid})
+        ON CREATE SET
+            f += $props,
+            f.first_seen = $timestamp,
+            f.last_seen = $timestamp
+        ON MATCH SET
+            f.last_seen = $timestamp
+        """
+
+        tx.run(
+            query,
+            uuid=finding_uuid,
+            props=self._finding_props(finding),
+            timestamp=timestamp
+        )
+        self.metrics['node_Finding'] += 1
+        return finding_uuid
+
+    def _create_relationship(
+        self,
+        tx: Transaction,
+        from_label: str,
+        from_id_prop: str,
+        from_id: str,
+        rel_type: str,
+        to_label: str,
+        to_id_prop: str,
+        to_id: str,
+        timestamp: str,
+        props: Dict = None
+    ):
+        """Create a relationship between two nodes."""
+        rel_props = props or {}
+        rel_props['created_at'] = timestamp
+
+        # Each (shape, property set) pair is one statement; build it once
+        key = (from_label, from_id_prop, rel_type, to_label, to_id_prop,
+               tuple(sorted(rel_props)))
+        query = self._rel_queries.get(key)
+        if query is None:
+            set_clause = ', '.join(f'r.{k} = ${k}' for k in sorted(rel_props))
+            query = self._rel_queries[key] = f"""
+            MATCH (a:{from_label} {{{from_id_prop}: $from_id}})
+            MATCH (b:{to_label} {{{to_id_prop}: $to_id}})
+            MERGE (a)-[r:{rel_type}]->(b)
+            ON CREATE SET {set_clause}
+            """
+
+        params = {
+            'from_id': from_id,
+            'to_id': to_id
+        }
+        params.update(rel_props)
+
+        tx.run(query, **params)
+        self.metrics[f'rel_{rel_type}'] += 1
+
+    def load_finding(self, tx: Transaction, finding: Dict, timestamp: str = None):
+        """
+        Load a single finding into Neo4j with all relationships.
+
+        Creates nodes and relationships:
+        - Paper -[:REPORTS]-> Finding
+        - Finding -[:AFFECTS]-> Phenotype
+        - Finding -[:OBSERVED_IN]-> Tissue (if present)
+        - Finding -[:OBSERVED_IN]-> CellType (if present)
+        - Finding -[:IN_ORGANISM]-> Organism (if present)
+        """
+        pmcid = finding.get('pmcid')
+
+        # One timestamp per finding instead of one per query
+        if timestamp is None:
+            timestamp = self._get_current_timestamp()
+
+        # Ensure Paper node
+        self._ensure_paper_node(tx, pmcid, timestamp)
+
+        # Ensure Finding node
+        finding_uuid = self._ensure_finding_node(tx, finding, timestamp)
+
+        # Paper -[:REPORTS]-> Finding
+        prov = finding.get('provenance') or {}
+        evidence = finding.get('evidence_strength') or {}
+
+        self._create_relationship(
+            tx,
+            'Paper', 'pmcid', pmcid,
+            'REPORTS',
+            'Finding', 'uuid', finding_uuid,
+            timestamp,
+            {
+                'provenance': prov.get('section', '') if prov else '',
+                'extraction_confidence': evidence.get('score', 0.0) if evidence else 0.0
+            }
+        )
+
+        # Phenotype
+        if finding.get('phenotype'):
+            pheno = finding['phenotype'].get('ontology_term')
+            if pheno:
+                pheno_id = self._ensure_ontology_node(tx, 'Phenotype', pheno, timestamp)
+
+                mag = finding.get('magnitude') or {}
+                self._create_relationship(
+                    tx,
+                    'Finding', 'uuid', finding_uuid,
+                    'AFFECTS',
+                    'Phenotype', 'obo_id', pheno_id,
+                    timestamp,
+                    {
+                        'direction': finding.get('direction'),
+                        'magnitude': mag.get('value') if mag else None,
+                        'p_value': finding.get('p_value')
+                    }
+                )
+
+        # Tissue
+        if finding.get('tissue'):
+            tissue = finding['tissue'].get('ontology_term')
+            if tissue:
+                tissue_id = self._ensure_ontology_node(tx, 'Tissue', tissue, timestamp)
+
+                self._create_relationship(
+                    tx,
+                    'Finding', 'uuid', finding_uuid,
+                    'OBSERVED_IN',
+                    'Tissue', 'obo_id', tissue_id,
+                    timestamp
+                )
+
+        # CellType
+        if finding.get('cell_type'):
+            cell = finding['cell_type'].get('ontology_term')
+            if cell:
+                cell_id = self._ensure_ontology_node(tx, 'CellType', cell, timestamp)
+
+                self._create_relationship(
+                    tx,
+                    'Finding', 'uuid', finding_uuid,
+                    'OBSERVED_IN',
+                    'CellType', 'obo_id', cell_id,
+                    timestamp
+                )
+
+        # Organism
+        if finding.get('organism'):
+            org = finding['organism'].get('ontology_term')
+            if org:
+                org_id = self._ensure_ontology_node(tx, 'Organism', org, timestamp, {
+                    'strain': finding['organism'].get('strain'),
+                    'sex': finding['organism'].get('sex')
+                })
+
+                self._create_relationship(
+                    tx,
+                    'Finding', 'uuid', finding_uuid,
+                    'IN_ORGANISM',
+                    'Organism', 'obo_id', org_id,
+                    timestamp
+                )
+
+    @staticmethod
+    def _finding_props(finding: Dict) -> Dict[str, Any]:
+        """
+        Flatten a finding dict into Finding node properties.
+
+        Keys whose value would be null are dropped: they would be
+        serialized over Bolt only for SET += to discard them server-side.
+        """
+        mag = finding.get('magnitude') or _EMPTY
+        prov = finding.get('provenance') or _EMPTY
+
+        props = {
+            'pmcid': finding.get('pmcid'),
+            'direction': finding.get('direction'),
+            'p_value': finding.get('p_value'),
+            'evidence_strength': (finding.get('evidence_strength') or _EMPTY).get('score', 0.0),
+            'sample_size': finding.get('sample_size'),
+            'timepoint': finding.get('timepoint'),
+            'qualifiers': finding.get('qualifiers', []),
+            'quotes': finding.get('quotes', []),
+            'magnitude_value': mag.get('value'),
+            'magnitude_unit': mag.get('unit'),
+            'magnitude_method': mag.get('method'),
+            'provenance_section': prov.get('section'),
+            'provenance_source_type': prov.get('source_type')
+        }
+        return {k: v for k, v in props.items() if v is not None}
+
+    def _prepare_findings_batch(self, findings: List[Dict]):
+        """
+        Group a batch of findings into UNWIND-able row lists.
+
+        Returns:
+            Tuple of (paper_rows, ontology_rows keyed by label,
+                      affects_rows, observed_rows keyed by target label,
+                      organism_rel_rows)
+
+        Each paper row carries its findings nested, so one statement can
+        MERGE the Paper, its Findings, and the REPORTS edges while the
+        Paper node is still at hand.
+        """
+        papers: Dict[str, Dict] = {}
+        ontology_rows = defaultdict(list)
+        affects_rows = []
+        observed_rows = defaultdict(list)
+        organism_rel_rows = []
+
+        for finding in findings:
+            pmcid = finding.get('pmcid')
+            finding_uuid = self._finding_uuid(finding)
+            prov = finding.get('provenance') or _EMPTY
+            evidence = finding.get('evidence_strength') or _EMPTY
+
+            paper = papers.get(pmcid)
+            if paper is None:
+                paper = papers[pmcid] = {'pmcid': pmcid, 'findings': []}
+            paper['findings'].append({
+                'uuid': finding_uuid,
+                'props': self._finding_props(finding),
+                'provenance': prov.get('section', ''),
+                'extraction_confidence': evidence.get('score', 0.0)
+            })
+
+            # Only emit rows for terms with a usable id: a null obo_id row
+            # would make every later MATCH evaluate a guaranteed-miss probe
+            pheno = (finding.get('phenotype') or _EMPTY).get('ontology_term')
+            if pheno and pheno.get('id'):
+                mag = finding.get('magnitude') or _EMPTY
+                ontology_rows['Phenotype'].append({
+                    'obo_id': pheno.get('id'),
+                    'label_text': pheno.get('label'),
+                    'source_obo': pheno.get('source_obo'),
+                    'synonyms': pheno.get('synonyms', []),
+                    'extra': _EMPTY
+                })
+                affects_rows.append({
+                    'uuid': finding_uuid,
+                    'obo_id': pheno.get('id'),
+                    'direction': finding.get('direction'),
+                    'magnitude': mag.get('value'),
+                    'p_value': finding.get('p_value')
+                })
+
+            for field, label in (('tissue', 'Tissue'), ('cell_type', 'CellType')):
+                term = (finding.get(field) or _EMPTY).get('ontology_term')
+                if term and term.get('id'):
+                    ontology_rows[label].append({
+                        'obo_id': term.get('id'),
+                        'label_text': term.get('label'),
+                        'source_obo': term.get('source_obo'),
+                        'synonyms': term.get('synonyms', []),
+                        'extra': _EMPTY
+                    })
+                    observed_rows[label].append({
+                        'uuid': finding_uuid,
+                        'obo_id': term.get('id')
+                    })
+
+            organism = finding.get('organism') or _EMPTY
+            org = organism.get('ontology_term')
+            if org and org.get('id'):
+                ontology_rows['Organism'].append({
+                    'obo_id': org.get('id'),
+                    'label_text': org.get('label'),
+                    'source_obo': org.get('source_obo'),
+                    'synonyms': org.get('synonyms', []),
+                    'extra': {
+                        'strain': organism.get('strain'),
+                        'sex': organism.get('sex')
+                    }
+                })
+                organism_rel_rows.append({
+                    'uuid': finding_uuid,
+                    'obo_id': org.get('id')
+                })
+
+        # One MERGE row per distinct node: duplicate rows in an UNWIND
+        # re-lock the same node once per row. Papers are already one row per
+        # pmcid; ontology nodes collapse per obo_id, carrying an occurrence
+        # count so source_count still reflects every mention.
+        for label, rows in ontology_rows.items():
+            collapsed: Dict[str, Dict] = {}
+            for row in rows:
+                existing = collapsed.get(row['obo_id'])
+                if existing is None:
+                    row['occurrences'] = 1
+                    collapsed[row['obo_id']] = row
+                else:
+                    existing['occurrences'] += 1
+                    # Union synonym lists so no mention's synonyms are lost
+                    # to whichever row happened to come first
+                    synonyms = row.get('synonyms')
+                    if synonyms and synonyms != existing['synonyms']:
+                        existing['synonyms'] = list(
+                            dict.fromkeys([*existing['synonyms'], *synonyms])
+                        )
+            ontology_rows[label] = list(collapsed.values())
+
+        return (list(papers.values()), ontology_rows,
+                affects_rows, observed_rows, organism_rel_rows)
+
+    @staticmethod
+    def _relationship_statements(affects_rows, observed_rows, organism_rel_rows):
+        """
+        Yield (statement body, rows) pairs for the relationship writes.
+
+        Each body assumes a bound `row` variable so it can run either under
+        a plain UNWIND or inside CALL { ... } IN CONCURRENT TRANSACTIONS.
+        """
+        if affects_rows:
+            yield ("""
+            MATCH (a:Finding {uuid: row.uuid})
+            MATCH (b:Phenotype {obo_id: row.obo_id})
+            MERGE (a)-[r:AFFECTS]->(b)
+            ON CREATE SET
+                r.direction = row.direction,
+                r.magnitude = row.magnitude,
+                r.p_value = row.p_value,
+                r.created_at = $timestamp
+            """, affects_rows)
+
+        for label, rows in observed_rows.items():
+            yield (f"""
+            MATCH (a:Finding {{uuid: row.uuid}})
+            MATCH (b:{label} {{obo_id: row.obo_id}})
+            MERGE (a)-[r:OBSERVED_IN]->(b)
+            ON CREATE SET r.created_at = $timestamp
+            """, rows)
+
+        if organism_rel_rows:
+            yield ("""
+            MATCH (a:Finding {uuid: row.uuid})
+            MATCH (b:Organism {obo_id: row.obo_id})
+            MERGE (a)-[r:IN_ORGANISM]->(b)
+            ON CREATE SET r.created_at = $timestamp
+            """, organism_rel_rows)
+
+    def _load_findings_tx(
+        self,
+        tx,
+        paper_rows,
+        ontology_rows,
+        affects_rows,
+        observed_rows,
+        organism_rel_rows,
+        timestamp
+    ):
+        """Write one prepared batch of findings inside a single transaction."""
+        # Paper, its Findings, and REPORTS fused into one statement: each
+        # Paper merges once and is still bound when its REPORTS edges merge
+        tx.run("""
+        UNWIND $rows AS row
+        MERGE (p:Paper {pmcid: row.pmcid})
+        ON CREATE SET
+            p.first_seen = $timestamp,
+            p.last_seen = $timestamp
+        ON MATCH SET
+            p.last_seen = $timestamp
+        WITH p, row
+        UNWIND row.findings AS finding
+        MERGE (f:Finding {uuid: finding.uuid})
+        ON CREATE SET
+            f += finding.props,
+            f.first_seen = $timestamp,
+            f.last_seen = $timestamp
+        ON MATCH SET
+            f.last_seen = $timestamp
+        MERGE (p)-[r:REPORTS]->(f)
+        ON CREATE SET
+            r.provenance = finding.provenance,
+            r.extraction_confidence = finding.extraction_confidence,
+            r.created_at = $timestamp
+        """, rows=paper_rows, timestamp=timestamp)
+
+        for label, rows in ontology_rows.items():
+            tx.run(f"""
+            UNWIND $rows AS row
+            MERGE (n:{label} {{obo_id: row.obo_id}})
+            ON CREATE SET
+                n.label = row.label_text,
+                n.source_obo = row.source_obo,
+                n.synonyms = row.synonyms,
+                n += row.extra,
+                n.first_seen = $timestamp,
+                n.last_seen = $timestamp,
+                n.source_count = row.occurrences
+            ON MATCH SET
+                n.last_seen = $timestamp,
+                n.source_count = COALESCE(n.source_count, 0) + row.occurrences
+            """, rows=rows, timestamp=timestamp)
+
+        for body, rows in self._relationship_statements(
+            affects_rows, observed_rows, organism_rel_rows
+        ):
+            tx.run(f"UNWIND $rows AS row {body}", rows=rows, timestamp=timestamp)
+
+    def _write_batch_with_retry(self, session, *tx_args):
+        """
+        Run one batch transaction with explicit begin_transaction and a
+        bounded retry on transient errors.
+
+        Unlike execute_write's managed retries, a replay here reuses the
+        already-prepared row lists instead of redoing any Python-side work.
+        """
+        for attempt in range(self._MAX_TX_RETRIES + 1):
+            try:
+                with session.begin_transaction() as tx:
+                    self._load_findings_tx(tx, *tx_args)
+                    tx.commit()
+                return
+            except TransientError as e:
+                if attempt == self._MAX_TX_RETRIES:
+                    raise
+                delay = min(2 ** attempt * 0.1, 2.0)
+                logger.warning(
+                    f"Transient error on batch (attempt {attempt + 1}), "
+                    f"retrying in {delay:.2f}s: {e}"
+                )
+                self.metrics['retries'] += 1
+                time.sleep(delay)
+
+    def load_findings_batch(self, findings: List[Dict]):
+        """Load a batch of findings in one UNWIND-batched transaction."""
+        if self.dry_run:
+            logger.info(f"Dry-run: would load batch of {len(findings)} findings")
+            return
+
+        timestamp = self._get_current_timestamp()
+
+        # Adjacent rows with the same MERGE target keep lock acquisition
+        # and the MERGE cache warm within the UNWIND
+        findings = sorted(findings, key=lambda f: (
+            f.get('pmcid') or '',
+            ((f.get('phenotype') or {}).get('ontology_term') or {}).get('id') or ''
+        ))
+
+        (paper_rows, ontology_rows,
+         affects_rows, observed_rows, organism_rel_rows) = self._prepare_findings_batch(findings)
+
+        try:
+            session = self._get_session()
+            if self.concurrent_tx:
+                # Nodes commit first, then each relationship statement
+                # runs as an implicit transaction whose sub-batches the
+                # server spreads across threads (Finding/ontology pairs
+                # are mostly disjoint, so they rarely contend)
+                self._write_batch_with_retry(
+                    session,
+                    paper_rows, ontology_rows,
+                    [], {}, [],
+                    timestamp
+                )
+                for body, rows in self._relationship_statements(
+                    affects_rows, observed_rows, organism_rel_rows
+                ):
+                    session.run(
+                        f"UNWIND $rows AS row "
+                        f"CALL {{ WITH row {body} }} "
+                        f"IN CONCURRENT TRANSACTIONS OF 200 ROWS",
+                        rows=rows, timestamp=timestamp
+                    ).consume()
+            else:
+                self._write_batch_with_retry(
+                    session,
+                    paper_rows, ontology_rows,
+                    affects_rows, observed_rows, organism_rel_rows,
+                    timestamp
+                )
+        except Exception as e:
+            logger.error(f"Error loading batch of {len(findings)} findings: {e}")
+            self.metrics['errors'] += len(findings)
+            return
+
+        # Tally locally, merge into the shared Counter once per batch
+        local = Counter()
+        num_findings = sum(len(p['findings']) for p in paper_rows)
+        local['node_Paper'] = len(paper_rows)
+        local['node_Finding'] = num_findings
+        local['rel_REPORTS'] = num_findings
+        for label, rows in ontology_rows.items():
+            local[f'node_{label}'] += sum(r['occurrences'] for r in rows)
+        local['rel_AFFECTS'] = len(affects_rows)
+        for rows in observed_rows.values():
+            local['rel_OBSERVED_IN'] += len(rows)
+        local['rel_IN_ORGANISM'] = len(organism_rel_rows)
+        self.metrics.update(local)
+
+    def load_from_jsonl(self, input_path: Path) -> Dict[str, int]:
+        """
+        Load findings from JSONL file.
+
+        Args:
+            input_path: Path to findings.jsonl
+
+        Returns:
+            Metrics dictionary
+        """
+        if not input_path.exists():
+            raise FileNotFoundError(f"Input file not found: {input_path}")
+
+        total_loaded = 0
+
+        logger.info(f"Loading findings from {input_path}")
+
+        # Parse and write overlap: a producer thread reads and parses the
+        # next batches while the main thread waits on Neo4j. The bounded
+        # queue applies back-pressure so a fast parser cannot buffer the
+        # whole file in memory.
+        batch_queue: queue.Queue = queue.Queue(maxsize=4)
+
+        def _iter_lines(f):
+            # Memory-map and split on newlines directly: no buffered-reader
+            # copy per line, and the bytes slices feed orjson as-is. Falls
+            # back to plain iteration when mmap is unavailable (empty file,
+            # non-regular file).
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                yield from f
+                return
+            try:
+                start = 0
+                size = len(mm)
+                while start < size:
+                    nl = mm.find(b'\n', start)
+                    if nl < 0:
+                        yield mm[start:]
+                        break
+                    yield mm[start:nl]
+                    start = nl + 1
+            finally:
+                mm.close()
+
+        def _parse_batches():
+            # Binary mode skips the per-line UTF-8 decode; orjson takes
+            # bytes directly and the stdlib fallback accepts them too
+            loads = orjson.loads if orjson is not None else json.loads
+            findings = []
+
+            with open(input_path, 'rb') as f:
+                for line_num, line in enumerate(_iter_lines(f), 1):
+                    if not line.strip():
+                        continue
+
+                    try:
+                        finding = loads(line)
+                    except ValueError as e:
+                        logger.error(f"JSON decode error at line {line_num}: {e}")
+                        self.metrics['parse_errors'] += 1
+                        continue
+
+                    findings.append(finding)
+                    if len(findings) >= self.batch_size:
+                        batch_queue.put(findings)
+                        findings = []
+
+            if findings:
+                batch_queue.put(findings)
+            batch_queue.put(None)
+
+        producer = threading.Thread(
+            target=_parse_batches, name='jsonl-parser', daemon=True
+        )
+        producer.start()
+
+        while True:
+            findings = batch_queue.get()
+            if findings is None:
+                break
+            self.load_findings_batch(findings)
+            total_loaded += len(findings)
+            logger.info(f"Loaded {total_loaded} findings...")
+
+        producer.join()
+
+        self.metrics['total_loaded'] = total_loaded
+        logger.info(f"Completed loading {total_loaded} findings")
+
+        return dict(self.metrics)
+
+    def get_graph_metrics(self) -> Dict[str, Any]:
+        """Get graph statistics."""
+        if self.dry_run:
+            return {'dry_run': True}
+
+        metrics = {}
+
+        with self.driver.session(database=self.database) as session:
+            # The count store serves per-label and per-type totals in O(1);
+            # the previous per-label MATCH count(n) queries scanned the
+            # whole label each time
+            try:
+                record = session.run("""
+                    CALL apoc.meta.stats()
+                    YIELD labels, relTypesCount
+                    RETURN labels, relTypesCount
+                """).single()
+
+                for label, count in record['labels'].items():
+                    metrics[f"node_count_{label}"] = count
+                for rel_type, count in record['relTypesCount'].items():
+                    metrics[f"rel_count_{rel_type}"] = count
+                return metrics
+            except Exception as e:
+                logger.warning(f"apoc.meta.stats unavailable, counting by scan: {e}")
+
+            # Fallback: per-label scans (slow on large graphs)
+            result = session.run("""
+                CALL db.labels() YIELD label
+                CALL apoc.cypher.run('MATCH (n:' + label + ') RETURN count(n) as count', {})
+                YIELD value
+                RETURN label, value.count as count
+            """)
+
+            for record in result:
+                metrics[f"node_count_{record['label']}"] = record['count']
+
+            result = session.run("""
+                CALL db.relationshipTypes() YIELD relationshipType
+                CALL apoc.cypher.run('MATCH ()-[r:' + relationshipType + ']->() RETURN count(r) as count', {})
+                YIELD value
+                RETURN relationshipType, value.count as count
+            """)
+
+            for record in result:
+                metrics[f"rel_count_{record['relationshipType']}"] = record['count']
+
+        return metrics
+
+
+def main():
+    """CLI entrypoint: python -m kg.load_to_neo4j --uri bolt://neo4j:7687 --user neo4j --password pass --input /data/jsonl/findings.jsonl"""
+    parser = argparse.ArgumentParser(
+        description="Load findings into Neo4j knowledge graph"
+    )
+    parser.add_argument('--uri', type=str, default='bolt://localhost:7687', help='Neo4j URI')
+    parser.add_argument('--user', type=str, default='neo4j', help='Neo4j username')
+    parser.add_argument('--password', type=str, required=True, help='Neo4j password')
+    parser.add_argument('--database', type=str, default='neo4j', help='Neo4j database name')
+    parser.add_argument('--input', type=str, required=True, help='Input findings.jsonl path')
+    parser.add_argument('--batch-size', type=int, default=100, help='Batch size for loading')
+    parser.add_argument('--dry-run', action='store_true', help='Dry run (no database writes)')
+    parser.add_argument('--concurrent-tx', action='store_true',
+                        help='Write relationships with concurrent server transactions (Neo4j 5.21+)')
+    parser.add_argument('--init-schema', action='store_true', help='Initialize schema first')
+    parser.add_argument('--metrics-output', type=str, help='Output metrics to NDJSON file')
+    parser.add_argument('--log-level', type=str, default='INFO', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'])
+
+    args = parser.parse_args()
+
+    # Setup logging
+    logging.basicConfig(
+        level=getattr(logging, args.log_level),
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    # Initialize loader
+    loader = Neo4jLoader(
+        uri=args.uri,
+        user=args.user,
+        password=args.password,
+        database=args.database,
+        batch_size=args.batch_size,
+        dry_run=args.dry_run,
+        concurrent_tx=args.concurrent_tx
+    )
+
+    try:
+        # Initialize schema if requested
+        if args.init_schema:
+            logger.info("Initializing Neo4j schema...")
+            loader.initialize_schema()
+
+        # Load findings
+        input_path = Path(args.input)
+        metrics = loader.load_from_jsonl(input_path)
+
+        # Get graph metrics
+        if not args.dry_run:
+            graph_metrics = loader.get_graph_metrics()
+            metrics.update(graph_metrics)
+
+        # Print metrics
+        logger.info("=== Load Metrics ===")
+        for key, value in sorted(metrics.items()):
+            logger.info(f"{key}: {value}")
+
+        # Save metrics to file if requested
+        if args.metrics_output:
+            metrics_path = Path(args.metrics_output)
+            metrics_path.parent.mkdir(parents=True, exist_ok=True)
+
+            metrics['timestamp'] = datetime.utcnow().isoformat()
+            metrics['input_file'] = str(input_path)
+            if orjson is not None:
+                buf = orjson.dumps(metrics) + b'\n'
+            else:
+                buf = (json.dumps(metrics, ensure_ascii=False) + '\n').encode('utf-8')
+
+            # Binary append: one write of pre-serialized bytes, no text codec
+            with open(metrics_path, 'ab') as f:
+                f.write(buf)
+
+            logger.info(f"Metrics saved to {metrics_path}")
+
+    finally:
+        loader.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,7 @@
  * Perfect for Vercel deployment without needing a separate backend server.
  */
 
-import type { KGGraph, KGNode, Paper } from '../types';
+import type { KGEdge, KGGraph, KGNode, Paper } from '../types';
 
 const BASE_PATH = '/data/neo4j';
 
@@ -20,6 +20,76 @@ async function fetchJSON<T>(path: string): Promise<T> {
   return response.json();
 }
 
+/**
+ * Fetch static NDJSON file (one JSON record per line)
+ *
+ * Streams the body and parses records as complete lines arrive, so large
+ * files never need a full in-memory string before parsing starts.
+ */
+async function fetchNDJSON<T>(path: string): Promise<T[]> {
+  const response = await fetch(`${BASE_PATH}/${path}`);
+  if (!response.ok) {
+    throw new Error(`Failed to fetch ${path}: ${response.statusText}`);
+  }
+
+  const rows: T[] = [];
+
+  if (response.body) {
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    for (;;) {
+      const { done, value } = await reader.read();
+      if (done) break;
+      buffer += decoder.decode(value, { stream: true });
+      const lines = buffer.split('\n');
+      buffer = lines.pop() ?? '';
+      for (const line of lines) {
+        if (line) rows.push(JSON.parse(line));
+      }
+    }
+    buffer += decoder.decode();
+    if (buffer.trim()) rows.push(JSON.parse(buffer));
+  } else {
+    // Environments without streaming bodies (older polyfills)
+    for (const line of (await response.text()).split('\n')) {
+      if (line) rows.push(JSON.parse(line));
+    }
+  }
+
+  return rows;
+}
+
+/**
+ * Normalized node/edge stores shared by all subgraphs
+ *
+ * Subgraph files carry only IDs; the properties live once in nodes.json
+ * and edges.json. Cache the store fetches so resolving many subgraphs
+ * costs two requests total.
+ */
+interface SubgraphRefs {
+  pmcid: string;
+  node_ids: string[];
+  edge_ids: string[];
+}
+
+let nodeStorePromise: Promise<Record<string, KGNode>> | null = null;
+let edgeStorePromise: Promise<Record<string, KGEdge>> | null = null;
+
+function getNodeStore(): Promise<Record<string, KGNode>> {
+  if (!nodeStorePromise) {
+    nodeStorePromise = fetchJSON<Record<string, KGNode>>('nodes.json');
+  }
+  return nodeStorePromise;
+}
+
+function getEdgeStore(): Promise<Record<string, KGEdge>> {
+  if (!edgeStorePromise) {
+    edgeStorePromise = fetchJSON<Record<string, KGEdge>>('edges.json');
+  }
+  return edgeStorePromise;
+}
+
 /**
  * Get knowledge graph overview
  */
@@ -29,14 +99,23 @@ export async function getKnowledgeGraphStatic(params?: {
   limit?: number;
 }): Promise<KGGraph> {
   try {
-    // If center node specified, load that subgraph
+    // If center node specified, load that subgraph and resolve its ID
+    // references against the normalized stores
     if (params?.centerNode) {
       const pmcid = params.centerNode.toUpperCase();
       try {
-        const subgraph = await fetchJSON<KGGraph>(`subgraphs/${pmcid}.json`);
+        const [subgraph, nodeStore, edgeStore] = await Promise.all([
+          fetchJSON<SubgraphRefs>(`subgraphs/${pmcid}.json`),
+          getNodeStore(),
+          getEdgeStore()
+        ]);
         return {
-          nodes: subgraph.nodes || [],
-          edges: subgraph.edges || []
+          nodes: (subgraph.node_ids || [])
+            .map(id => nodeStore[id])
+            .filter((n): n is KGNode => n !== undefined),
+          edges: (subgraph.edge_ids || [])
+            .map(id => edgeStore[id])
+            .filter((e): e is KGEdge => e !== undefined)
         };
       } catch (e) {
         console.warn(`Subgraph not found for ${pmcid}, loading overview`);
@@ -91,7 +170,12 @@ export async function getKnowledgeGraphStatic(params?: {
  */
 export async function getPapersStatic(): Promise<Record<string, Paper>> {
   try {
-    return await fetchJSON<Record<string, Paper>>('papers.json');
+    const rows = await fetchNDJSON<Paper>('papers.jsonl');
+    const papers: Record<string, Paper> = {};
+    for (const row of rows) {
+      papers[row.pmcid] = row;
+    }
+    return papers;
   } catch (error) {
     console.error('Failed to load papers:', error);
     return {};
@@ -116,7 +200,7 @@ export async function getPaperStatic(pmcid: string): Promise<Paper | null> {
  */
 export async function getConsensusStatic(): Promise<any[]> {
   try {
-    return await fetchJSON<any[]>('consensus.json');
+    return await fetchNDJSON<any>('consensus.jsonl');
   } catch (error) {
     console.error('Failed to load consensus data:', error);
     return [];
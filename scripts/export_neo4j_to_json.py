@@ -5,13 +5,28 @@ This script exports all data from Neo4j to JSON files that can be
 used by the frontend without needing a backend server.
 """
 
+import argparse
+import gzip
 import os
 import json
-from neo4j import GraphDatabase
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from neo4j import GraphDatabase, READ_ACCESS
 from dotenv import load_dotenv
 import logging
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -27,159 +42,264 @@ NEO4J_PASSWORD = os.getenv('NEO4J_PASSWORD', 'spacebio123')
 OUTPUT_DIR = Path('public/data/neo4j')
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
+# Compact JSON by default; --pretty flips this for local debugging
+PRETTY = False
+
+
+def _read_session(driver):
+    """Open a read session tuned for bulk streaming exports.
+
+    100k-record fetches cut the per-1000-row PULL round-trips, and the
+    explicit read access mode routes to followers on a cluster.
+    """
+    return driver.session(database='neo4j', fetch_size=100000,
+                          default_access_mode=READ_ACCESS)
+
+
+def _write_compressed(path, data):
+    """Write pre-compressed .gz (and .br if brotli is installed) siblings.
+
+    Vercel serves pre-compressed assets directly, skipping per-request
+    edge compression.
+    """
+    with open(str(path) + '.gz', 'wb') as f:
+        f.write(gzip.compress(data, compresslevel=6))
+    if brotli is not None:
+        with open(str(path) + '.br', 'wb') as f:
+            f.write(brotli.compress(data, quality=11))
+
+
+def _dump_json(obj, path):
+    """Write obj as JSON, using orjson's C serializer when available.
+
+    Output is compact unless --pretty was passed; the whitespace roughly
+    doubles the size of the artifacts committed for Vercel.
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if PRETTY else 0
+        data = orjson.dumps(obj, option=option)
+    elif PRETTY:
+        data = json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+    else:
+        data = json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    path.write_bytes(data)
+    _write_compressed(path, data)
+
+
+# Display labels are memoized: phenotype nodes recur across subgraphs,
+# so each distinct label is truncated once
+_label_cache = {}
+
+
+def _display_label(full_label, fallback):
+    """Truncate a node label for display (20 chars max)."""
+    text = full_label if full_label is not None else fallback
+    label = _label_cache.get(text)
+    if label is None:
+        label = text[:17] + '...' if len(text) > 20 else text
+        _label_cache[text] = label
+    return label
+
+
+def _dump_jsonl_line(obj):
+    """Serialize one NDJSON record to bytes (always compact)."""
+    if orjson is not None:
+        return orjson.dumps(obj) + b'\n'
+    return (json.dumps(obj, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
+
+
+# Query text lives in module constants so every run sends byte-identical
+# strings and hits the server's plan cache; only parameters may vary
+_OVERVIEW_PAPERS_CYPHER = """
+MATCH (p:Paper)
+RETURN p.pmcid AS id, p.pmcid AS fullLabel,
+       'Paper' AS type, properties(p) AS properties
+"""
+
+_OVERVIEW_PHENOTYPES_CYPHER = """
+MATCH (ph:Phenotype)
+RETURN ph.obo_id AS id, ph.label AS fullLabel,
+       'Phenotype' AS type, properties(ph) AS properties
+"""
+
+_OVERVIEW_EDGES_CYPHER = """
+MATCH (p:Paper)-[r1:REPORTS]->(f:Finding)-[r2:AFFECTS]->(ph:Phenotype)
+RETURN DISTINCT toString(id(r1)) AS id, p.pmcid AS source,
+       ph.obo_id AS target, 'REPORTS' AS type
+"""
+
+_PAPERS_CYPHER = """
+MATCH (p:Paper)
+RETURN p.pmcid as pmcid, properties(p) as properties
+"""
+
+_SUBGRAPHS_CYPHER = """
+MATCH (p:Paper)-[r1:REPORTS]->(f:Finding)-[r2:AFFECTS]->(ph:Phenotype)
+WITH p,
+    collect(DISTINCT ph.obo_id) AS phenotype_ids,
+    collect(DISTINCT toString(id(r1))) AS edge_ids
+RETURN p.pmcid AS pmcid, phenotype_ids, edge_ids
+"""
+
+_CONSENSUS_CYPHER = """
+MATCH (p:Paper)-[:REPORTS]->(f:Finding)-[:AFFECTS]->(ph:Phenotype)
+WITH ph,
+     count(f) as num_findings,
+     count(CASE WHEN f.direction = 'increased' THEN 1 END) as increased_count,
+     count(CASE WHEN f.direction = 'decreased' THEN 1 END) as decreased_count,
+     count(CASE WHEN f.direction = 'no_change' THEN 1 END) as no_change_count,
+     collect(p.pmcid) as papers
+WHERE num_findings > 1
+RETURN
+    ph.obo_id as phenotype_id,
+    ph.label as phenotype_label,
+    num_findings,
+    increased_count,
+    decreased_count,
+    no_change_count,
+    papers
+ORDER BY num_findings DESC
+"""
+
+_NODE_COUNTS_CYPHER = """
+MATCH (n)
+RETURN labels(n)[0] as label, count(n) as count
+ORDER BY count DESC
+"""
+
+_REL_COUNTS_CYPHER = """
+MATCH ()-[r]->()
+RETURN type(r) as type, count(r) as count
+ORDER BY count DESC
+"""
+
 
 def export_graph_overview(driver):
     """Export full knowledge graph (nodes and edges)."""
     logger.info("Exporting graph overview...")
 
-    with driver.session() as session:
-        # Get all nodes and relationships
-        query = """
-        MATCH (p:Paper)-[r1:REPORTS]->(f:Finding)-[r2:AFFECTS]->(ph:Phenotype)
-        WITH p, f, ph, r1, r2
-        RETURN
-            collect(DISTINCT {
-                id: p.pmcid,
-                label: CASE
-                    WHEN size(coalesce(p.pmcid, 'Paper')) > 20
-                    THEN substring(coalesce(p.pmcid, 'Paper'), 0, 17) + '...'
-                    ELSE coalesce(p.pmcid, 'Paper')
-                END,
-                fullLabel: p.pmcid,
-                type: 'Paper',
-                properties: {pmcid: p.pmcid}
-            }) + collect(DISTINCT {
-                id: ph.obo_id,
-                label: CASE
-                    WHEN size(coalesce(ph.label, 'Phenotype')) > 20
-                    THEN substring(coalesce(ph.label, 'Phenotype'), 0, 17) + '...'
-                    ELSE coalesce(ph.label, 'Phenotype')
-                END,
-                fullLabel: ph.label,
-                type: 'Phenotype',
-                properties: {obo_id: ph.obo_id, label: ph.label}
-            }) AS nodes,
-            collect(DISTINCT {
-                id: toString(id(r1)),
-                source: p.pmcid,
-                target: ph.obo_id,
-                type: 'REPORTS',
-                properties: {}
-            }) AS edges
-        """
-
-        result = session.run(query)
-        record = result.single()
+    with _read_session(driver) as session:
+        # Three focused queries: the old single-path MATCH emitted one row
+        # per (paper, finding, phenotype) triple, so every node was
+        # projected once per incident path before DISTINCT deduped it.
+        # Scanning each label directly visits each node exactly once.
+        nodes = []
+        for record in session.run(_OVERVIEW_PAPERS_CYPHER):
+            nodes.append(dict(record))
+        for record in session.run(_OVERVIEW_PHENOTYPES_CYPHER):
+            nodes.append(dict(record))
+
+        # Display labels are truncated client-side so the server skips
+        # per-node CASE/substring work
+        for node in nodes:
+            node['label'] = _display_label(node['fullLabel'], node['type'])
+
+        edges = []
+        for record in session.run(_OVERVIEW_EDGES_CYPHER):
+            edge = dict(record)
+            edge['properties'] = {}
+            edges.append(edge)
 
         graph_data = {
-            'nodes': record['nodes'],
-            'edges': record['edges'],
-            'num_nodes': len(record['nodes']),
-            'num_edges': len(record['edges'])
+            'nodes': nodes,
+            'edges': edges,
+            'num_nodes': len(nodes),
+            'num_edges': len(edges)
         }
 
         output_file = OUTPUT_DIR / 'graph_overview.json'
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(graph_data, f, ensure_ascii=False, indent=2)
+        _dump_json(graph_data, output_file)
+
+        # Normalized stores keyed by id: subgraph files reference these
+        # instead of duplicating shared node/edge properties per paper
+        _dump_json({node['id']: node for node in nodes}, OUTPUT_DIR / 'nodes.json')
+        _dump_json({edge['id']: edge for edge in edges}, OUTPUT_DIR / 'edges.json')
 
         logger.info(f"✓ Exported {graph_data['num_nodes']} nodes, {graph_data['num_edges']} edges")
         logger.info(f"  → {output_file}")
 
 
 def export_papers(driver):
-    """Export all papers with metadata."""
+    """Export all papers with metadata as NDJSON, one paper per line."""
     logger.info("Exporting papers...")
 
-    with driver.session() as session:
-        query = """
-        MATCH (p:Paper)
-        RETURN p.pmcid as pmcid, properties(p) as properties
-        """
+    with _read_session(driver) as session:
+        result = session.run(_PAPERS_CYPHER)
 
-        result = session.run(query)
-        papers = {}
+        # Stream records straight to disk: the client can parse line by
+        # line and the export never holds every paper in memory
+        output_file = OUTPUT_DIR / 'papers.jsonl'
+        count = 0
+        with open(output_file, 'wb') as f:
+            for record in result:
+                row = {'pmcid': record['pmcid'], **record['properties']}
+                f.write(_dump_jsonl_line(row))
+                count += 1
 
-        for record in result:
-            pmcid = record['pmcid']
-            papers[pmcid] = record['properties']
+        _write_compressed(output_file, output_file.read_bytes())
 
-        output_file = OUTPUT_DIR / 'papers.json'
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(papers, f, ensure_ascii=False, indent=2)
-
-        logger.info(f"✓ Exported {len(papers)} papers")
+        logger.info(f"✓ Exported {count} papers")
         logger.info(f"  → {output_file}")
 
 
 def export_paper_subgraphs(driver):
-    """Export individual subgraphs for each paper."""
+    """Export individual subgraphs for each paper.
+
+    Subgraph files carry only node/edge IDs; the properties live once in
+    nodes.json / edges.json and the frontend joins on load.
+    """
     logger.info("Exporting paper subgraphs...")
 
     subgraph_dir = OUTPUT_DIR / 'subgraphs'
     subgraph_dir.mkdir(exist_ok=True)
 
-    with driver.session() as session:
-        # Get all paper PMCIDs
-        result = session.run("MATCH (p:Paper) RETURN p.pmcid as pmcid")
-        pmcids = [record['pmcid'] for record in result]
-
-        logger.info(f"  Found {len(pmcids)} papers")
-
-        for i, pmcid in enumerate(pmcids):
-            # Get subgraph for this paper
-            query = """
-            MATCH (p:Paper {pmcid: $pmcid})-[r1:REPORTS]->(f:Finding)-[r2:AFFECTS]->(ph:Phenotype)
-            RETURN
-                collect(DISTINCT {
-                    id: p.pmcid,
-                    label: CASE
-                        WHEN size(coalesce(p.pmcid, 'Paper')) > 20
-                        THEN substring(coalesce(p.pmcid, 'Paper'), 0, 17) + '...'
-                        ELSE coalesce(p.pmcid, 'Paper')
-                    END,
-                    fullLabel: p.pmcid,
-                    type: 'Paper',
-                    properties: properties(p)
-                }) + collect(DISTINCT {
-                    id: ph.obo_id,
-                    label: CASE
-                        WHEN size(coalesce(ph.label, 'Phenotype')) > 20
-                        THEN substring(coalesce(ph.label, 'Phenotype'), 0, 17) + '...'
-                        ELSE coalesce(ph.label, 'Phenotype')
-                    END,
-                    fullLabel: ph.label,
-                    type: 'Phenotype',
-                    properties: properties(ph)
-                }) AS nodes,
-                collect(DISTINCT {
-                    id: toString(id(r1)),
-                    source: p.pmcid,
-                    target: ph.obo_id,
-                    type: 'REPORTS',
-                    properties: {}
-                }) AS edges
-            """
-
-            result = session.run(query, pmcid=pmcid)
-            record = result.single()
-
-            if record and record['nodes']:
+    with _read_session(driver) as session:
+        # Writer threads serialize and write files while the main thread
+        # keeps draining the cursor, so disk I/O overlaps bolt parsing
+        num_writers = 4
+        write_queue = queue.Queue(maxsize=64)
+
+        def _writer():
+            while True:
+                item = write_queue.get()
+                if item is None:
+                    break
+                path, data = item
+                _dump_json(data, path)
+
+        writers = [threading.Thread(target=_writer) for _ in range(num_writers)]
+        for thread in writers:
+            thread.start()
+
+        count = 0
+        try:
+            # One query streams every paper's subgraph grouped by pmcid
+            # instead of a round trip per paper
+            for record in session.run(_SUBGRAPHS_CYPHER):
+                pmcid = record['pmcid']
+                node_ids = [pmcid] + record['phenotype_ids']
+                edge_ids = record['edge_ids']
+
                 subgraph_data = {
                     'pmcid': pmcid,
-                    'nodes': record['nodes'],
-                    'edges': record['edges'],
-                    'num_nodes': len(record['nodes']),
-                    'num_edges': len(record['edges'])
+                    'node_ids': node_ids,
+                    'edge_ids': edge_ids,
+                    'num_nodes': len(node_ids),
+                    'num_edges': len(edge_ids)
                 }
 
-                output_file = subgraph_dir / f'{pmcid}.json'
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump(subgraph_data, f, ensure_ascii=False, indent=2)
+                write_queue.put((subgraph_dir / f'{pmcid}.json', subgraph_data))
 
-            if (i + 1) % 100 == 0:
-                logger.info(f"  Exported {i + 1}/{len(pmcids)} subgraphs...")
+                count += 1
+                if count % 100 == 0:
+                    logger.info(f"  Exported {count} subgraphs...")
+        finally:
+            for _ in writers:
+                write_queue.put(None)
+            for thread in writers:
+                thread.join()
 
-        logger.info(f"✓ Exported {len(pmcids)} subgraphs")
+        logger.info(f"✓ Exported {count} subgraphs")
         logger.info(f"  → {subgraph_dir}")
 
 
@@ -187,64 +307,48 @@ def export_consensus(driver):
     """Export consensus phenotype data."""
     logger.info("Exporting consensus data...")
 
-    with driver.session() as session:
-        # Aggregate findings by phenotype
-        query = """
-        MATCH (p:Paper)-[:REPORTS]->(f:Finding)-[:AFFECTS]->(ph:Phenotype)
-        WITH ph,
-             collect(f.direction) as directions,
-             count(f) as num_findings,
-             collect(p.pmcid) as papers
-        WHERE num_findings > 1
-        RETURN
-            ph.obo_id as phenotype_id,
-            ph.label as phenotype_label,
-            directions,
-            num_findings,
-            papers,
-            size([d IN directions WHERE d = 'increased']) as increased_count,
-            size([d IN directions WHERE d = 'decreased']) as decreased_count,
-            size([d IN directions WHERE d = 'no_change']) as no_change_count
-        ORDER BY num_findings DESC
-        """
-
-        result = session.run(query)
-        consensus_data = []
-
-        for record in result:
-            total = record['num_findings']
-            increased = record['increased_count']
-            decreased = record['decreased_count']
-            no_change = record['no_change_count']
-
-            # Calculate consensus direction
-            if increased > total * 0.6:
-                consensus = 'increased'
-                confidence = increased / total
-            elif decreased > total * 0.6:
-                consensus = 'decreased'
-                confidence = decreased / total
-            else:
-                consensus = 'mixed'
-                confidence = max(increased, decreased, no_change) / total
-
-            consensus_data.append({
-                'phenotype_id': record['phenotype_id'],
-                'phenotype_label': record['phenotype_label'],
-                'consensus_direction': consensus,
-                'confidence': round(confidence, 2),
-                'num_studies': total,
-                'increased_count': increased,
-                'decreased_count': decreased,
-                'no_change_count': no_change,
-                'papers': record['papers']
-            })
-
-        output_file = OUTPUT_DIR / 'consensus.json'
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(consensus_data, f, ensure_ascii=False, indent=2)
-
-        logger.info(f"✓ Exported {len(consensus_data)} consensus phenotypes")
+    with _read_session(driver) as session:
+        # Aggregate findings by phenotype; conditional counts tally each
+        # direction in the same pass instead of filtering a collected
+        # list three times per phenotype
+        result = session.run(_CONSENSUS_CYPHER)
+        output_file = OUTPUT_DIR / 'consensus.jsonl'
+        count = 0
+
+        with open(output_file, 'wb') as f:
+            for record in result:
+                total = record['num_findings']
+                increased = record['increased_count']
+                decreased = record['decreased_count']
+                no_change = record['no_change_count']
+
+                # Calculate consensus direction
+                if increased > total * 0.6:
+                    consensus = 'increased'
+                    confidence = increased / total
+                elif decreased > total * 0.6:
+                    consensus = 'decreased'
+                    confidence = decreased / total
+                else:
+                    consensus = 'mixed'
+                    confidence = max(increased, decreased, no_change) / total
+
+                f.write(_dump_jsonl_line({
+                    'phenotype_id': record['phenotype_id'],
+                    'phenotype_label': record['phenotype_label'],
+                    'consensus_direction': consensus,
+                    'confidence': round(confidence, 2),
+                    'num_studies': total,
+                    'increased_count': increased,
+                    'decreased_count': decreased,
+                    'no_change_count': no_change,
+                    'papers': record['papers']
+                }))
+                count += 1
+
+        _write_compressed(output_file, output_file.read_bytes())
+
+        logger.info(f"✓ Exported {count} consensus phenotypes")
         logger.info(f"  → {output_file}")
 
 
@@ -252,32 +356,41 @@ def export_statistics(driver):
     """Export database statistics."""
     logger.info("Exporting statistics...")
 
-    with driver.session() as session:
+    with _read_session(driver) as session:
         stats = {}
 
-        # Node counts by type
-        result = session.run("""
-            MATCH (n)
-            RETURN labels(n)[0] as label, count(n) as count
-            ORDER BY count DESC
-        """)
-        stats['node_counts'] = {record['label']: record['count'] for record in result}
-
-        # Relationship counts by type
-        result = session.run("""
-            MATCH ()-[r]->()
-            RETURN type(r) as type, count(r) as count
-            ORDER BY count DESC
-        """)
-        stats['relationship_counts'] = {record['type']: record['count'] for record in result}
-
-        # Total counts
-        stats['total_nodes'] = sum(stats['node_counts'].values())
-        stats['total_relationships'] = sum(stats['relationship_counts'].values())
+        # Prefer the maintained count store via apoc.meta.stats — O(1)
+        # regardless of graph size — and fall back to full label and
+        # relationship scans when APOC is not installed
+        try:
+            record = session.run(
+                "CALL apoc.meta.stats() "
+                "YIELD labels, relTypesCount, nodeCount, relCount "
+                "RETURN labels, relTypesCount, nodeCount, relCount"
+            ).single()
+            stats['node_counts'] = dict(
+                sorted(record['labels'].items(), key=lambda kv: -kv[1]))
+            stats['relationship_counts'] = dict(
+                sorted(record['relTypesCount'].items(), key=lambda kv: -kv[1]))
+            stats['total_nodes'] = record['nodeCount']
+            stats['total_relationships'] = record['relCount']
+        except Exception as e:
+            logger.info(f"  apoc.meta.stats unavailable ({e}); scanning instead")
+
+            # Node counts by type
+            result = session.run(_NODE_COUNTS_CYPHER)
+            stats['node_counts'] = {record['label']: record['count'] for record in result}
+
+            # Relationship counts by type
+            result = session.run(_REL_COUNTS_CYPHER)
+            stats['relationship_counts'] = {record['type']: record['count'] for record in result}
+
+            # Total counts
+            stats['total_nodes'] = sum(stats['node_counts'].values())
+            stats['total_relationships'] = sum(stats['relationship_counts'].values())
 
         output_file = OUTPUT_DIR / 'statistics.json'
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(stats, f, ensure_ascii=False, indent=2)
+        _dump_json(stats, output_file)
 
         logger.info(f"✓ Exported statistics")
         logger.info(f"  Total nodes: {stats['total_nodes']:,}")
@@ -293,8 +406,10 @@ def create_index_file():
         'exported_at': None,  # Will be set when running
         'files': {
             'graph_overview': 'graph_overview.json',
-            'papers': 'papers.json',
-            'consensus': 'consensus.json',
+            'nodes': 'nodes.json',
+            'edges': 'edges.json',
+            'papers': 'papers.jsonl',
+            'consensus': 'consensus.jsonl',
             'statistics': 'statistics.json',
             'subgraphs': 'subgraphs/'
         },
@@ -305,20 +420,34 @@ def create_index_file():
     index['exported_at'] = datetime.datetime.now().isoformat()
 
     output_file = OUTPUT_DIR / 'index.json'
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(index, f, ensure_ascii=False, indent=2)
+    _dump_json(index, output_file)
 
     logger.info(f"✓ Created index file")
     logger.info(f"  → {output_file}")
 
 
 def main():
+    global PRETTY
+
+    parser = argparse.ArgumentParser(description='Export Neo4j data to static JSON files')
+    parser.add_argument('--pretty', action='store_true',
+                        help='Indent JSON output (larger files, for local debugging)')
+    args = parser.parse_args()
+    PRETTY = args.pretty
+
     logger.info("=" * 60)
     logger.info("Neo4j to JSON Export Tool")
     logger.info("=" * 60)
     logger.info(f"\nConnecting to Neo4j: {NEO4J_URI}")
 
-    driver = GraphDatabase.driver(NEO4J_URI, auth=(NEO4J_USER, NEO4J_PASSWORD))
+    driver = GraphDatabase.driver(
+        NEO4J_URI,
+        auth=(NEO4J_USER, NEO4J_PASSWORD),
+        max_connection_pool_size=50,
+        connection_acquisition_timeout=60,
+        max_connection_lifetime=3600,
+        fetch_size=10000,
+    )
 
     try:
         driver.verify_connectivity()
@@ -327,13 +456,28 @@ def main():
         logger.error(f"✗ Connection failed: {e}")
         return
 
+    # Warm up a pooled connection and the routing table for the target
+    # database so the first real export query does not pay for them.
+    # Sessions are not thread-safe, so the concurrent exporters each keep
+    # their own session spanning the whole function instead of sharing one.
+    with _read_session(driver) as session:
+        session.run("RETURN 1").consume()
+
     try:
-        # Export all data
-        export_statistics(driver)
-        export_papers(driver)
-        export_graph_overview(driver)
-        export_consensus(driver)
-        export_paper_subgraphs(driver)
+        # The exports are independent, so run them concurrently; each one
+        # opens its own session and the driver pool handles the rest
+        exporters = [
+            export_statistics,
+            export_papers,
+            export_graph_overview,
+            export_consensus,
+            export_paper_subgraphs,
+        ]
+        with ThreadPoolExecutor(max_workers=len(exporters)) as executor:
+            futures = [executor.submit(fn, driver) for fn in exporters]
+            for future in futures:
+                future.result()
+
         create_index_file()
 
         logger.info("\n" + "=" * 60)
@@ -341,7 +485,7 @@ def main():
         logger.info("=" * 60)
         logger.info(f"\nOutput directory: {OUTPUT_DIR}")
         logger.info("\nFiles created:")
-        for file in sorted(OUTPUT_DIR.glob('*.json')):
+        for file in sorted(OUTPUT_DIR.glob('*.json*')):
             size = file.stat().st_size / 1024  # KB
             logger.info(f"  - {file.name} ({size:.1f} KB)")
 
@@ -351,6 +495,17 @@ def main():
             total_size = sum(f.stat().st_size for f in subgraph_dir.glob('*.json')) / 1024 / 1024  # MB
             logger.info(f"  - subgraphs/ ({subgraph_count} files, {total_size:.1f} MB)")
 
+        raw_total = sum(
+            f.stat().st_size for f in OUTPUT_DIR.rglob('*')
+            if f.is_file() and not f.name.endswith(('.gz', '.br'))
+        )
+        gz_total = sum(f.stat().st_size for f in OUTPUT_DIR.rglob('*.gz'))
+        if raw_total and gz_total:
+            logger.info(
+                f"\nCompression: {raw_total / 1024:.0f} KB raw → "
+                f"{gz_total / 1024:.0f} KB gzip ({gz_total / raw_total:.0%})"
+            )
+
         logger.info("\nNext steps:")
         logger.info("1. Commit the exported data: git add public/data/neo4j")
         logger.info("2. Deploy to Vercel (data will be included)")
@@ -39,7 +39,7 @@ print("=" * 60)
 
 def get_stats(driver, label="Database"):
     """Get database statistics."""
-    with driver.session() as session:
+    with driver.session(database='neo4j') as session:
         # Count nodes
         node_count = session.run("MATCH (n) RETURN count(n) as count").single()['count']
 
@@ -71,11 +71,13 @@ def get_stats(driver, label="Database"):
 def clear_target_database(target_driver):
     """Clear all data from target database."""
     logger.info("\nClearing target database...")
-    with target_driver.session() as session:
-        # Delete all relationships first
-        session.run("MATCH ()-[r]->() DELETE r")
-        # Then delete all nodes
-        session.run("MATCH (n) DELETE n")
+    with target_driver.session(database='neo4j') as session:
+        # Delete in committed chunks; a single full-graph transaction can
+        # exhaust the target's heap on a large graph
+        session.run(
+            "MATCH (n) CALL { WITH n DETACH DELETE n } "
+            "IN TRANSACTIONS OF 10000 ROWS"
+        ).consume()
     logger.info("✓ Target database cleared")
 
 
@@ -83,90 +85,279 @@ def migrate_nodes(source_driver, target_driver, label):
     """Migrate nodes of a specific label."""
     logger.info(f"\nMigrating {label} nodes...")
 
-    with source_driver.session() as source_session:
-        # Get all nodes of this label
-        query = f"MATCH (n:{label}) RETURN n"
-        result = source_session.run(query)
-        nodes = [record['n'] for record in result]
-
-        logger.info(f"  Found {len(nodes)} {label} nodes")
-
-        # Batch insert into target
-        with target_driver.session() as target_session:
-            batch_size = 1000
-            for i in range(0, len(nodes), batch_size):
-                batch = nodes[i:i+batch_size]
-
-                # Create nodes with properties
-                for node in batch:
-                    props = dict(node)
-                    labels_str = ':'.join(node.labels)
-
-                    # Build CREATE query
-                    prop_str = ', '.join([f"{k}: ${k}" for k in props.keys()])
-                    query = f"CREATE (n:{labels_str} {{{prop_str}}})"
-                    target_session.run(query, **props)
-
-                logger.info(f"  Migrated {min(i+batch_size, len(nodes))}/{len(nodes)} nodes")
-
-    logger.info(f"✓ Completed {label} nodes")
-
-
-def migrate_relationships(source_driver, target_driver, rel_type):
+    batch_size = 1000
+    id_prop = _ID_PROPS.get(label)
+    if id_prop:
+        # MERGE on the ID property makes reruns incremental instead of
+        # duplicating nodes, so a failed migration can simply be restarted
+        write_query = (
+            f"UNWIND $batch AS props "
+            f"MERGE (n:{label} {{{id_prop}: props.{id_prop}}}) "
+            f"SET n += props"
+        )
+    else:
+        write_query = f"UNWIND $batch AS props CREATE (n:{label}) SET n = props"
+
+    def _write_batch(tx, rows):
+        tx.run(write_query, batch=rows).consume()
+
+    with source_driver.session(database='neo4j') as source_session:
+        # Stream property maps from the source; one UNWIND write per
+        # 1000-row batch amortizes the commit and bolt overhead that the
+        # old per-node CREATE paid on every single node
+        result = source_session.run(f"MATCH (n:{label}) RETURN properties(n) AS props")
+
+        migrated = 0
+        batch = []
+        with target_driver.session(database='neo4j') as target_session:
+            for record in result:
+                batch.append(record['props'])
+                if len(batch) >= batch_size:
+                    target_session.execute_write(_write_batch, batch)
+                    migrated += len(batch)
+                    batch = []
+                    logger.info(f"  Migrated {migrated} nodes...")
+
+            if batch:
+                target_session.execute_write(_write_batch, batch)
+                migrated += len(batch)
+
+    logger.info(f"✓ Completed {migrated} {label} nodes")
+
+
+def _source_supports_apoc_bolt(source_driver):
+    """Check whether the source can run server-side migration via APOC."""
+    try:
+        with source_driver.session(database='neo4j') as session:
+            result = session.run(
+                "SHOW PROCEDURES YIELD name "
+                "WHERE name IN ['apoc.periodic.iterate', 'apoc.bolt.execute'] "
+                "RETURN count(*) AS n"
+            )
+            return result.single()['n'] == 2
+    except Exception as e:
+        logger.info(f"  APOC bolt migration unavailable: {e}")
+        return False
+
+
+def _build_bolt_url(uri, user, password):
+    """Embed credentials into a bolt URI for apoc.bolt.execute."""
+    scheme, _, rest = uri.partition('://')
+    return f"{scheme}://{user}:{password}@{rest}"
+
+
+def migrate_nodes_server_side(source_driver, label, target_url):
+    """Migrate nodes of a specific label without round-tripping the client.
+
+    apoc.periodic.iterate runs concurrent batches inside the source server
+    and apoc.bolt.execute writes each node straight to the target, so the
+    Python process never handles the row data.
+    """
+    logger.info(f"\nMigrating {label} nodes (server-side)...")
+    id_prop = _ID_PROPS.get(label)
+
+    with source_driver.session(database='neo4j') as session:
+        result = session.run(
+            "CALL apoc.periodic.iterate($fetch, $action, "
+            "{batchSize: 1000, parallel: true, concurrency: 8, "
+            "params: {target: $target, write: $write}}) "
+            "YIELD total, errorMessages "
+            "RETURN total, errorMessages",
+            fetch=f"MATCH (n:{label}) RETURN n",
+            action=(
+                "CALL apoc.bolt.execute($target, $write, "
+                "{props: properties(n)}) YIELD row RETURN count(*)"
+            ),
+            target=target_url,
+            write=(
+                f"MERGE (m:{label} {{{id_prop}: $props.{id_prop}}}) SET m += $props"
+                if id_prop else f"CREATE (m:{label}) SET m = $props"
+            ),
+        )
+        record = result.single()
+        errors = record['errorMessages'] or {}
+        if errors:
+            raise RuntimeError(f"server-side batch errors: {errors}")
+
+    logger.info(f"✓ Completed {label} nodes ({record['total']:,} rows, server-side)")
+
+
+def _build_id_prop_map(source_driver, labels):
+    """Resolve each label's ID property once by sampling a single node.
+
+    Saves the per-endpoint priority-list probing in the relationship hot
+    loop: two dict lookups per edge instead of two list traversals.
+    """
+    id_prop_map = {}
+    with source_driver.session(database='neo4j') as session:
+        for label in labels:
+            record = session.run(
+                f"MATCH (n:{label}) RETURN properties(n) AS props LIMIT 1"
+            ).single()
+            if record:
+                resolved = _get_id_property(label, record['props'])
+                if resolved:
+                    id_prop_map[label] = resolved[0]
+    return id_prop_map
+
+
+def migrate_relationships(source_driver, target_driver, rel_type, id_prop_map):
     """Migrate relationships of a specific type."""
     logger.info(f"\nMigrating {rel_type} relationships...")
 
-    with source_driver.session() as source_session:
-        # Get all relationships with node identifiers
-        query = f"""
-        MATCH (a)-[r:{rel_type}]->(b)
-        RETURN
-            labels(a) as source_labels,
-            properties(a) as source_props,
-            type(r) as rel_type,
-            properties(r) as rel_props,
-            labels(b) as target_labels,
-            properties(b) as target_props
-        """
-        result = source_session.run(query)
-        rels = list(result)
-
-        logger.info(f"  Found {len(rels)} {rel_type} relationships")
-
-        # Create relationships in target
-        with target_driver.session() as target_session:
-            for i, rel in enumerate(rels):
-                # Match source node
-                source_label = rel['source_labels'][0]
-                source_id_prop = _get_id_property(source_label, rel['source_props'])
-
-                # Match target node
-                target_label = rel['target_labels'][0]
-                target_id_prop = _get_id_property(target_label, rel['target_props'])
-
-                if not source_id_prop or not target_id_prop:
-                    logger.warning(f"  Skipping relationship {i}: missing ID property")
+    batch_size = 1000
+    migrated = 0
+    skipped = 0
+
+    with source_driver.session(database='neo4j') as source_session:
+        # Find which (source label, target label) pairs this type connects,
+        # then run one typed query per pair that returns just the endpoint
+        # IDs — the full node property bags no longer cross the wire
+        pairs = [
+            (record['source_label'], record['target_label'])
+            for record in source_session.run(
+                f"MATCH (a)-[r:{rel_type}]->(b) "
+                f"RETURN DISTINCT labels(a)[0] AS source_label, "
+                f"labels(b)[0] AS target_label"
+            )
+        ]
+
+        with target_driver.session(database='neo4j') as target_session:
+            for source_label, target_label in pairs:
+                source_key = id_prop_map.get(source_label)
+                target_key = id_prop_map.get(target_label)
+
+                if not source_key or not target_key:
+                    logger.warning(
+                        f"  Skipping ({source_label})-[:{rel_type}]->({target_label}): "
+                        f"no ID property"
+                    )
                     continue
 
-                # Create relationship
-                query = f"""
-                MATCH (a:{source_label} {{{source_id_prop[0]}: $source_id}})
-                MATCH (b:{target_label} {{{target_id_prop[0]}: $target_id}})
-                CREATE (a)-[r:{rel_type}]->(b)
-                SET r = $rel_props
-                """
-
-                target_session.run(
-                    query,
-                    source_id=source_id_prop[1],
-                    target_id=target_id_prop[1],
-                    rel_props=rel['rel_props'] or {}
+                key = (rel_type, source_label, source_key, target_label, target_key)
+                result = source_session.run(
+                    f"MATCH (a:{source_label})-[r:{rel_type}]->(b:{target_label}) "
+                    f"RETURN a.{source_key} AS source_id, "
+                    f"b.{target_key} AS target_id, "
+                    f"properties(r) AS rel_props"
                 )
 
-                if (i + 1) % 1000 == 0:
-                    logger.info(f"  Migrated {i+1}/{len(rels)} relationships")
+                batch = []
+                for rel in result:
+                    if rel['source_id'] is None or rel['target_id'] is None:
+                        skipped += 1
+                        continue
+
+                    batch.append({
+                        'source_id': rel['source_id'],
+                        'target_id': rel['target_id'],
+                        'rel_props': rel['rel_props'] or {}
+                    })
+
+                    if len(batch) >= batch_size:
+                        _flush_relationship_batch(target_session, key, batch)
+                        migrated += len(batch)
+                        batch = []
+                        logger.info(f"  Migrated {migrated} relationships...")
+
+                if batch:
+                    _flush_relationship_batch(target_session, key, batch)
+                    migrated += len(batch)
+
+        if skipped:
+            logger.warning(f"  Skipped {skipped} relationships: missing ID property")
+        logger.info(f"✓ Completed {migrated} {rel_type} relationships")
+
+
+# Compiled UNWIND statements keyed by
+# (rel_type, source_label, source_id_key, target_label, target_id_key),
+# so every batch sharing a bucket reuses the same query text and the
+# server's plan cache
+_REL_QUERY_CACHE = {}
+
+
+def _flush_relationship_batch(target_session, key, rows):
+    """Write one batch of relationships to the target via UNWIND."""
+    query = _REL_QUERY_CACHE.get(key)
+    if query is None:
+        rel_type, source_label, source_id_key, target_label, target_id_key = key
+        query = f"""
+        UNWIND $rows AS row
+        MATCH (a:{source_label} {{{source_id_key}: row.source_id}})
+        MATCH (b:{target_label} {{{target_id_key}: row.target_id}})
+        MERGE (a)-[r:{rel_type}]->(b)
+        SET r = row.rel_props
+        """
+        _REL_QUERY_CACHE[key] = query
+    target_session.run(query, rows=rows).consume()
+
+
+# Known (label, ID property) pairs that are unique in this schema,
+# following the same priority as _get_id_property
+_CONSTRAINT_SCHEMA = [
+    ('Paper', 'pmcid'),
+    ('Finding', 'uuid'),
+    ('Phenotype', 'obo_id'),
+    ('Organism', 'obo_id'),
+    ('Tissue', 'obo_id'),
+    ('CellType', 'obo_id'),
+]
+
+# Label → unique ID property, for MERGE-based idempotent writes
+_ID_PROPS = dict(_CONSTRAINT_SCHEMA)
+
+
+def create_target_constraints(target_driver, labels):
+    """Create uniqueness constraints on the target ID properties.
+
+    Each relationship MATCH looks nodes up by ID property; a constraint
+    turns that from a label scan into an index seek. Returns the
+    (label, prop) pairs that got a constraint so plain indexes can skip
+    them.
+    """
+    logger.info("\nCreating target constraints...")
+    constrained = set()
+
+    with target_driver.session(database='neo4j') as session:
+        for label, prop in _CONSTRAINT_SCHEMA:
+            if label not in labels:
+                continue
+            try:
+                session.run(
+                    f"CREATE CONSTRAINT {label.lower()}_{prop} IF NOT EXISTS "
+                    f"FOR (n:{label}) REQUIRE n.{prop} IS UNIQUE"
+                ).consume()
+                constrained.add((label, prop))
+            except Exception as e:
+                logger.warning(f"  Could not create constraint on {label}.{prop}: {e}")
+
+    logger.info("✓ Target constraints created")
+    return constrained
+
+
+def ensure_target_indexes(target_driver, labels, skip=()):
+    """Create lookup indexes on the target for the node ID properties.
+
+    The UNWIND batches match source and target nodes by their ID property,
+    so these lookups must be indexed or each MATCH degrades to a label scan.
+    Pairs in `skip` already carry a constraint-backed index.
+    """
+    logger.info("\nEnsuring target indexes...")
+    id_props = ['uuid', 'obo_id', 'pmcid', 'label']
+
+    with target_driver.session(database='neo4j') as session:
+        for label in labels:
+            for prop in id_props:
+                if (label, prop) in skip:
+                    continue
+                try:
+                    session.run(
+                        f"CREATE INDEX IF NOT EXISTS FOR (n:{label}) ON (n.{prop})"
+                    ).consume()
+                except Exception as e:
+                    logger.warning(f"  Could not create index on {label}.{prop}: {e}")
 
-        logger.info(f"✓ Completed {rel_type} relationships")
+    logger.info("✓ Target indexes ensured")
 
 
 def _get_id_property(label, props):
@@ -184,7 +375,13 @@ def _get_id_property(label, props):
 def main():
     # Connect to source
     logger.info("\nConnecting to source database...")
-    source_driver = GraphDatabase.driver(SOURCE_URI, auth=(SOURCE_USER, SOURCE_PASSWORD))
+    source_driver = GraphDatabase.driver(
+        SOURCE_URI,
+        auth=(SOURCE_USER, SOURCE_PASSWORD),
+        max_connection_pool_size=50,
+        connection_acquisition_timeout=60,
+        max_connection_lifetime=3600,
+    )
 
     try:
         source_driver.verify_connectivity()
@@ -195,7 +392,13 @@ def main():
 
     # Connect to target
     logger.info("\nConnecting to target database...")
-    target_driver = GraphDatabase.driver(TARGET_URI, auth=(TARGET_USER, TARGET_PASSWORD))
+    target_driver = GraphDatabase.driver(
+        TARGET_URI,
+        auth=(TARGET_USER, TARGET_PASSWORD),
+        max_connection_pool_size=50,
+        connection_acquisition_timeout=60,
+        max_connection_lifetime=3600,
+    )
 
     try:
         target_driver.verify_connectivity()
@@ -208,28 +411,49 @@ def main():
     # Get statistics
     source_stats = get_stats(source_driver, "Source")
 
-    # Confirm migration
+    # Confirm migration; clearing is optional now that writes MERGE on
+    # the ID properties and reruns are incremental
     print("\n" + "=" * 60)
-    print("WARNING: This will DELETE all data in the target database!")
-    confirm = input("Type 'yes' to continue: ").strip().lower()
+    print("Migration is idempotent (MERGE on ID properties).")
+    print("Clearing will DELETE all data in the target database first.")
+    confirm = input("Type 'yes' to clear, 'keep' to migrate into existing data: ").strip().lower()
 
-    if confirm != 'yes':
+    if confirm not in ('yes', 'keep'):
         logger.info("Migration cancelled")
         source_driver.close()
         target_driver.close()
         return
 
     try:
-        # Clear target
-        clear_target_database(target_driver)
+        # Optionally clear target, then put the schema in place before
+        # any writes
+        if confirm == 'yes':
+            clear_target_database(target_driver)
+        constrained = create_target_constraints(target_driver, source_stats['labels'])
+        ensure_target_indexes(target_driver, source_stats['labels'], skip=constrained)
+
+        # Prefer server-side migration when the source has APOC bolt
+        # procedures; otherwise fall back to driver-side batching
+        use_server_side = _source_supports_apoc_bolt(source_driver)
+        target_url = _build_bolt_url(TARGET_URI, TARGET_USER, TARGET_PASSWORD)
 
         # Migrate nodes by label
         for label in source_stats['labels']:
+            if use_server_side:
+                try:
+                    migrate_nodes_server_side(source_driver, label, target_url)
+                    continue
+                except Exception as e:
+                    logger.warning(
+                        f"  Server-side migration failed for {label}: {e}; "
+                        f"falling back to driver-side"
+                    )
             migrate_nodes(source_driver, target_driver, label)
 
         # Migrate relationships by type
+        id_prop_map = _build_id_prop_map(source_driver, source_stats['labels'])
         for rel_type in source_stats['rel_types']:
-            migrate_relationships(source_driver, target_driver, rel_type)
+            migrate_relationships(source_driver, target_driver, rel_type, id_prop_map)
 
         # Verify migration
         logger.info("\n" + "=" * 60)